@@ -0,0 +1,283 @@
+"""Caches for repeated council queries, conversation titles and stage outputs."""
+
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import re
+import sqlite3
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .config import (
+    COUNCIL_MODELS,
+    CHAIRMAN_MODEL,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_SIMILARITY,
+    COUNCIL_CACHE_MODE,
+    COUNCIL_CACHE_PATH,
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for exact matching (case and whitespace insensitive)."""
+    return " ".join(query.strip().lower().split())
+
+
+def query_key(query: str) -> str:
+    """Stable SHA-256 key for the normalized query."""
+    return hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
+
+
+def title_key(query: str) -> str:
+    """Cache key for a conversation title (the first 512 normalized characters)."""
+    return hashlib.sha256(normalize_query(query)[:512].encode("utf-8")).hexdigest()
+
+
+def embed_query(query: str) -> Dict[str, float]:
+    """
+    Embed a query as an L2-normalized sparse vector of word unigrams and bigrams.
+
+    Bigrams keep word order significant, so near-duplicates (punctuation,
+    casing, filler words) match while reworded questions do not.
+    """
+    tokens = _TOKEN_RE.findall(query.lower())
+    features = Counter(tokens)
+    features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+    norm = math.sqrt(sum(count * count for count in features.values()))
+    if not norm:
+        return {}
+    return {feature: count / norm for feature, count in features.items()}
+
+
+def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """Cosine similarity of two L2-normalized sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(feature, 0.0) for feature, weight in a.items())
+
+
+class ResponseCache:
+    """
+    Two-tier LRU cache of full council results.
+
+    Lookups first try an exact match on the normalized query hash, then
+    (only when similarity_threshold < 1.0) fall back to a semantic match over
+    the cached query embeddings.
+    """
+
+    def __init__(self, max_entries: int, similarity_threshold: float):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.semantic = similarity_threshold < 1.0
+        self._entries: "OrderedDict[str, Tuple[Dict[str, float], Any]]" = OrderedDict()
+
+    def lookup(self, query: str) -> Optional[Any]:
+        """Return the cached value for a query (or a near-identical one), else None."""
+        key = query_key(query)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        if not self.semantic:
+            return None
+
+        embedding = embed_query(query)
+        if not embedding:
+            return None
+
+        best_key = None
+        best_score = self.similarity_threshold
+        for cached_key, (cached_embedding, _) in self._entries.items():
+            score = _cosine(embedding, cached_embedding)
+            if score >= best_score:
+                best_key, best_score = cached_key, score
+
+        if best_key is None:
+            return None
+
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1]
+
+    def store(self, query: str, value: Any):
+        """Cache a value for a query, evicting the least recently used entries."""
+        key = query_key(query)
+        self._entries[key] = (embed_query(query) if self.semantic else {}, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_SIMILARITY)
+
+
+class LRUCache:
+    """Small exact-key LRU mapping."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None."""
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def set(self, key: str, value: Any):
+        """Cache a value, evicting the least recently used entries."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+title_cache = LRUCache(1024)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize objects with a to_dict() method (e.g. CouncilMember)."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class DiskCache:
+    """
+    SQLite-backed cache of pipeline stage outputs and model completions, keyed by a hash of their inputs.
+
+    mode is one of "off", "read", "write" or "readwrite". Keys include the
+    configured council and chairman models, so changing models never returns
+    stale entries.
+    """
+
+    def __init__(self, path: str, mode: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self.set_mode(mode)
+
+    def set_mode(self, mode: str):
+        """Switch between "off", "read", "write" and "readwrite" at runtime."""
+        self.readable = mode in ("read", "readwrite")
+        self.writable = mode in ("write", "readwrite")
+
+    @property
+    def enabled(self) -> bool:
+        return self.readable or self.writable
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS stage_cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+        return self._conn
+
+    @staticmethod
+    def key(inputs: Dict[str, Any]) -> str:
+        """SHA-256 of the JSON-normalized inputs (sorted keys, stripped strings)."""
+        def normalize(value: Any) -> Any:
+            if isinstance(value, str):
+                return value.strip()
+            if isinstance(value, dict):
+                return {k: normalize(v) for k, v in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [normalize(v) for v in value]
+            if hasattr(value, "to_dict"):
+                return normalize(value.to_dict())
+            return value
+
+        payload = json.dumps(
+            {"models": [COUNCIL_MODELS, CHAIRMAN_MODEL], "inputs": normalize(inputs)},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=_json_default,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss (or when reads are disabled)."""
+        if not self.readable:
+            return None
+        row = self._connect().execute(
+            "SELECT value FROM stage_cache WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+        if row is None:
+            return None
+        entry = json.loads(row[0])
+        return tuple(entry["value"]) if entry["tuple"] else entry["value"]
+
+    def set(self, namespace: str, key: str, value: Any):
+        """Store a JSON-serializable value (no-op when writes are disabled)."""
+        if not self.writable:
+            return
+        entry = json.dumps(
+            {"tuple": isinstance(value, tuple), "value": value},
+            default=_json_default,
+        )
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO stage_cache (namespace, key, value) VALUES (?, ?, ?)",
+            (namespace, key, entry),
+        )
+        conn.commit()
+
+
+disk_cache = DiskCache(COUNCIL_CACHE_PATH, COUNCIL_CACHE_MODE)
+
+
+def disk_cached(namespace: str, store_if: Optional[Callable[[Any], bool]] = None):
+    """
+    Cache an async pipeline stage in the disk cache, keyed by its bound arguments.
+
+    Args:
+        namespace: Stage name, kept separate from other stages' entries
+        store_if: Optional predicate; results failing it (e.g. errors) are not stored
+
+    Returns:
+        Decorator for an async function
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not disk_cache.enabled:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = disk_cache.key(bound.arguments)
+
+            cached = disk_cache.get(namespace, key)
+            if cached is not None:
+                return cached
+
+            result = await func(*args, **kwargs)
+            if store_if is None or store_if(result):
+                disk_cache.set(namespace, key, result)
+            return result
+
+        return wrapper
+
+    return decorator
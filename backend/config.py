@@ -29,6 +29,16 @@ CHAIRMAN_MODEL = "google/gemini-3-pro-preview"
 
 # OpenRouter API endpoint
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+OPENROUTER_MODELS_URL = "https://openrouter.ai/api/v1/models"
+
+# OpenRouter request limits - cap in-flight calls and retry rate limits / transient errors
+COUNCIL_MAX_CONCURRENCY = int(os.getenv("COUNCIL_MAX_CONCURRENCY", "6"))
+OPENROUTER_MAX_RETRIES = int(os.getenv("OPENROUTER_MAX_RETRIES", "3"))
+
+# Circuit breaker - after this many consecutive failed calls a model is skipped
+# (treated as not responding) for CIRCUIT_BREAKER_RESET seconds, then given one trial call
+CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3"))
+CIRCUIT_BREAKER_RESET = float(os.getenv("CIRCUIT_BREAKER_RESET", "30"))
 
 # Data directory for conversation storage
 DATA_DIR = "data/conversations"
@@ -36,3 +46,37 @@ DATA_DIR = "data/conversations"
 # Delphi Mode - Enable iterative reflection rounds
 # Set to True to enable Stage 1.5 where models can revise after seeing peer feedback
 DELPHI_MODE = os.getenv("DELPHI_MODE", "false").lower() == "true"
+
+# Response cache - reuse full council results for repeated questions. Matching is exact
+# (case/whitespace-insensitive) unless RESPONSE_CACHE_SIMILARITY is set below 1.0, which
+# also reuses results for near-identical wording. Word-overlap similarity cannot tell
+# "allowed" from "prohibited", so only lower it if that risk is acceptable.
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "256"))
+RESPONSE_CACHE_SIMILARITY = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "1.0"))
+
+# Stage 1 quorum - move on once this fraction of the council has answered, giving
+# stragglers STAGE1_QUORUM_GRACE more seconds before they are dropped. 1.0 waits for everyone.
+STAGE1_QUORUM = float(os.getenv("STAGE1_QUORUM", "1.0"))
+STAGE1_QUORUM_GRACE = float(os.getenv("STAGE1_QUORUM_GRACE", "2"))
+
+# Stage 1 hedging - once half the council has answered, members still running after
+# STAGE1_HEDGE_FACTOR x the median answer time get a duplicate request over the
+# latency-sorted provider route; the first answer wins. 0 disables.
+STAGE1_HEDGE_FACTOR = float(os.getenv("STAGE1_HEDGE_FACTOR", "0"))
+
+# Stage cache - persist Delphi / ranking / chairman outputs on disk, keyed by their inputs,
+# so replaying a conversation with identical Stage 1 answers skips those API calls.
+# off | read | write | readwrite
+COUNCIL_CACHE_MODE = os.getenv("COUNCIL_CACHE_MODE", "off").lower()
+COUNCIL_CACHE_PATH = os.getenv("COUNCIL_CACHE_PATH", "data/council_cache.sqlite")
+
+# Delphi pipelining - a member starts its reflection once this fraction of its peers
+# has answered Stage 1 (or after DELPHI_QUORUM_TIMEOUT seconds), rather than waiting
+# for the slowest council member. 1.0 waits for every peer.
+DELPHI_PEER_QUORUM = float(os.getenv("DELPHI_PEER_QUORUM", "0.75"))
+DELPHI_QUORUM_TIMEOUT = float(os.getenv("DELPHI_QUORUM_TIMEOUT", "30"))
+
+# Per-response token budget when responses are embedded in ranking / chairman prompts
+# (estimated at 4 characters per token; longer responses keep their head and tail). 0 disables.
+RESPONSE_TOKEN_BUDGET = int(os.getenv("RESPONSE_TOKEN_BUDGET", "1500"))
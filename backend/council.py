@@ -1,20 +1,47 @@
 """3-stage LLM Governance Council orchestration (with optional Delphi Round)."""
 
-from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Tuple, Optional, Callable, AsyncIterator, Iterable
+from dataclasses import dataclass
+from contextlib import aclosing
 import asyncio
+import math
 import re
+import statistics
 from collections import defaultdict
 
-from .openrouter import query_models_parallel, query_model
-from .config import COUNCIL_MODELS, CHAIRMAN_MODEL, DELPHI_MODE
+try:
+    import hyperscan
+except ImportError:  # optional: multi-pattern scanning for disagreement triggers
+    hyperscan = None
+
+from .openrouter import query_model, query_model_stream, StreamIncomplete
+from .config import (
+    COUNCIL_MODELS,
+    CHAIRMAN_MODEL,
+    DELPHI_MODE,
+    DELPHI_PEER_QUORUM,
+    DELPHI_QUORUM_TIMEOUT,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_TOKEN_BUDGET,
+    STAGE1_QUORUM,
+    STAGE1_QUORUM_GRACE,
+    STAGE1_HEDGE_FACTOR,
+)
+from .cache import response_cache, title_cache, title_key, disk_cache, disk_cached
+
+
+# Precompiled patterns for Delphi response parsing
+_RE_DECISION = re.compile(r"DECISION:\s*\[?(REVISE|AFFIRM)\]?", re.IGNORECASE)
+_RE_JUSTIFICATION = re.compile(r"JUSTIFICATION.*?:\s*(.*?)(?=FINAL RESPONSE:|$)", re.DOTALL | re.IGNORECASE)
+_RE_FINAL_RESPONSE = re.compile(r"FINAL RESPONSE:\s*(.*)", re.DOTALL | re.IGNORECASE)
+_RE_SENTENCE_SPLIT = re.compile(r"[.!?]+")
 
 
 # =========================
 # Data model: CouncilMember
 # =========================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CouncilMember:
     """
     Represents a council member with identity and role.
@@ -27,7 +54,8 @@ class CouncilMember:
     role: str    # Governance role: e.g., "Regulator", "Ethics Officer"
 
     def to_dict(self) -> Dict[str, str]:
-        return asdict(self)
+        # Flat fields only; avoids asdict()'s recursive deepcopy
+        return {"id": self.id, "model": self.model, "role": self.role}
 
     @property
     def label(self) -> str:
@@ -50,89 +78,212 @@ GOVERNANCE_ROLES = {
     "x-ai/grok-4": "Red Team",
 }
 
-def get_governance_role(model: str) -> str:
-    """Get governance role for a model, with fallbacks for ChatGPT and Mistral variants."""
-    # Check exact match first
+# Role-aware prompts to reduce correlated failure modes.
+SAFETY_ROLES = {
+    "anthropic/claude-sonnet-4.5": (
+        "You are an ethical analyst focused on alignment, responsible AI behavior, and "
+        "downstream impacts."
+    ),
+    "google/gemini-3-pro-preview": (
+        "You are a systems architect optimizing for clarity, robustness, and comprehensive "
+        "system design. You will also serve as the Chairman to synthesize final recommendations."
+    ),
+    "x-ai/grok-4": (
+        "You are a critical adversarial reviewer actively searching for flaws, edge cases, and hidden risks."
+    ),
+}
+
+# ChatGPT role definition (matches openai/chatgpt-* or openai/gpt-*)
+CHATGPT_ROLE = (
+    "You are a Systems Integrator & Failure-Mode Analyst. Your expertise is in identifying how "
+    "different components interact, where integration points fail, and what cascade failures might occur. "
+    "For each analysis, provide: (1) integration risks and failure modes, (2) cross-component dependencies, "
+    "(3) fault propagation paths, (4) resilience strategies, and (5) system-wide impact assessment."
+)
+
+# Mistral role definition (matches any model ID containing "mistral")
+MISTRAL_ROLE = (
+    "You are a Safety Engineer focused on Shadow AI & Data Leakage prevention. "
+    "Your expertise is in technical controls: AI gateways, DLP/redaction, allowlisting, "
+    "logging/audit trails, and kill switches. For each recommendation, provide: "
+    "(1) technical risks, (2) specific controls/guardrails, (3) evidence/logging requirements, "
+    "(4) testing procedures, and (5) go/no-go recommendation with justification."
+)
+
+
+def _is_chatgpt_variant(model_lower: str) -> bool:
+    """ChatGPT variants: openai/chatgpt-* or openai/gpt-*."""
+    return "openai/" in model_lower and "gpt" in model_lower
+
+
+def _is_mistral_variant(model_lower: str) -> bool:
+    """Mistral variants: any model ID containing "mistral"."""
+    return "mistral" in model_lower
+
+
+def _compute_governance_role(model: str) -> str:
+    """Resolve a governance role: exact match first, then ChatGPT and Mistral fallbacks."""
     if model in GOVERNANCE_ROLES:
         return GOVERNANCE_ROLES[model]
-    # Check if it's a ChatGPT variant (openai/chatgpt-* or openai/gpt-*)
-    if "openai/" in model.lower() and ("chatgpt" in model.lower() or "gpt" in model.lower()):
+    model_lower = model.lower()
+    if _is_chatgpt_variant(model_lower):
         return "Systems Integrator"
-    # Check if it's a Mistral variant
-    if "mistral" in model.lower():
+    if _is_mistral_variant(model_lower):
         return "Safety Engineer"
     return "Council Member"
 
 
+def _compute_role_prefix(model: str) -> Optional[str]:
+    """Resolve the Stage 1 role prompt: exact match first, then ChatGPT and Mistral fallbacks."""
+    if model in SAFETY_ROLES:
+        return SAFETY_ROLES[model]
+    model_lower = model.lower()
+    if _is_chatgpt_variant(model_lower):
+        return CHATGPT_ROLE
+    if _is_mistral_variant(model_lower):
+        return MISTRAL_ROLE
+    return None
+
+
+# Council models are fixed at import time, so resolve their roles once
+_ROLE_CACHE: Dict[str, str] = {m: _compute_governance_role(m) for m in COUNCIL_MODELS}
+_ROLE_PREFIX_CACHE: Dict[str, Optional[str]] = {m: _compute_role_prefix(m) for m in COUNCIL_MODELS}
+
+
+def get_governance_role(model: str) -> str:
+    """Get governance role for a model, with fallbacks for ChatGPT and Mistral variants."""
+    role = _ROLE_CACHE.get(model)
+    return role if role is not None else _compute_governance_role(model)
+
+
 # =========================
 # Stage 1: Collect responses
 # =========================
 
-async def stage1_collect_responses(user_query: str) -> Tuple[List[Dict[str, Any]], List[CouncilMember]]:
+async def stage1_collect_responses(
+    user_query: str,
+    on_response: Optional[Callable[[str, Optional[Dict[str, Any]]], None]] = None,
+) -> Tuple[List[Dict[str, Any]], List[CouncilMember]]:
     """
     Stage 1: Collect individual responses from all council models.
     Creates CouncilMember objects (identity mapping single source of truth).
 
+    If on_response is given, it is called with (model, response or None) as
+    each model finishes, so later stages can start before the slowest model.
+
+    Once STAGE1_QUORUM of the council has answered, the remaining models get
+    STAGE1_QUORUM_GRACE seconds before they are cancelled and treated as
+    non-responders. With STAGE1_HEDGE_FACTOR set, stragglers also get a
+    hedged duplicate request (see config.py).
+
     Returns:
       stage1_results: [{member_id, model, response}]
       council_members: [CouncilMember(...)]
     """
-    # Role-aware prompts to reduce correlated failure modes.
-    SAFETY_ROLES = {
-        "anthropic/claude-sonnet-4.5": (
-            "You are an ethical analyst focused on alignment, responsible AI behavior, and "
-            "downstream impacts."
-        ),
-        "google/gemini-3-pro-preview": (
-            "You are a systems architect optimizing for clarity, robustness, and comprehensive "
-            "system design. You will also serve as the Chairman to synthesize final recommendations."
-        ),
-        "x-ai/grok-4": (
-            "You are a critical adversarial reviewer actively searching for flaws, edge cases, and hidden risks."
-        ),
-    }
-    
-    # ChatGPT role definition (matches openai/chatgpt-* or openai/gpt-*)
-    CHATGPT_ROLE = (
-        "You are a Systems Integrator & Failure-Mode Analyst. Your expertise is in identifying how "
-        "different components interact, where integration points fail, and what cascade failures might occur. "
-        "For each analysis, provide: (1) integration risks and failure modes, (2) cross-component dependencies, "
-        "(3) fault propagation paths, (4) resilience strategies, and (5) system-wide impact assessment."
-    )
-    
-    # Mistral role definition (matches any model ID containing "mistral")
-    MISTRAL_ROLE = (
-        "You are a Safety Engineer focused on Shadow AI & Data Leakage prevention. "
-        "Your expertise is in technical controls: AI gateways, DLP/redaction, allowlisting, "
-        "logging/audit trails, and kill switches. For each recommendation, provide: "
-        "(1) technical risks, (2) specific controls/guardrails, (3) evidence/logging requirements, "
-        "(4) testing procedures, and (5) go/no-go recommendation with justification."
-    )
+    contents = _stage1_contents(user_query)
+
+    async def ask(model: str, tier: str = "standard") -> Tuple[str, Optional[Dict[str, Any]]]:
+        # An unexpected error counts as no response, so one member can't sink the stage
+        try:
+            return model, await query_model(model, [{"role": "user", "content": contents[model]}], tier=tier)
+        except Exception as e:
+            print(f"Error collecting Stage 1 response from {model}: {e}")
+            return model, None
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    quorum = math.ceil(STAGE1_QUORUM * len(COUNCIL_MODELS))
+    deadline: Optional[float] = None
+    answer_times: List[float] = []
+    hedge_at: Optional[float] = None
+    hedged = False
+
+    responses: Dict[str, Optional[Dict[str, Any]]] = {}
+    attempts = {model: {asyncio.create_task(ask(model))} for model in COUNCIL_MODELS}
+    pending = set().union(*attempts.values())
+    try:
+        while pending:
+            wake_at = min((t for t in (deadline, hedge_at) if t is not None), default=None)
+            timeout = None if wake_at is None else max(wake_at - loop.time(), 0.0)
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            if hedge_at is not None and loop.time() >= hedge_at:
+                # Race each straggler against a duplicate on the latency-sorted route
+                hedge_at = None
+                for model, tasks in attempts.items():
+                    if model not in responses:
+                        hedge = asyncio.create_task(ask(model, tier="high"))
+                        tasks.add(hedge)
+                        pending.add(hedge)
+
+            if not done and deadline is not None and loop.time() >= deadline:
+                break  # grace period over
+
+            for task in done:
+                model, resp = task.result()
+                if model in responses:
+                    continue  # the other attempt already answered
+                if resp is None and any(not t.done() for t in attempts[model]):
+                    continue  # the other attempt may still succeed
+
+                responses[model] = resp
+                for sibling in attempts[model]:
+                    if not sibling.done():
+                        sibling.cancel()
+                        pending.discard(sibling)
+
+                if resp is not None:
+                    answer_times.append(loop.time() - started_at)
+                if on_response is not None:
+                    on_response(model, resp)
+
+            answered = len(answer_times)
+            half_answered = answered and answered * 2 >= len(COUNCIL_MODELS)
+            if STAGE1_HEDGE_FACTOR > 0 and not hedged and half_answered:
+                hedged = True
+                hedge_at = started_at + statistics.median(answer_times) * STAGE1_HEDGE_FACTOR
+
+            if deadline is None and answered >= quorum:
+                deadline = loop.time() + STAGE1_QUORUM_GRACE
+    finally:
+        # Covers the quorum/grace exit and our caller being cancelled alike
+        for tasks in attempts.values():
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    return _assemble_stage1(responses)
+
+
+def _stage1_contents(user_query: str) -> Dict[str, str]:
+    """
+    Build the role-aware Stage 1 prompt text for every council model.
 
-    tasks = []
+    Models that share a role prefix (e.g. several ChatGPT variants) share one
+    prompt string instead of each formatting its own copy.
+    """
+    by_prefix: Dict[Optional[str], str] = {}
+    contents: Dict[str, str] = {}
     for model in COUNCIL_MODELS:
-        # Get role prefix - check exact match first, then ChatGPT/Mistral fallbacks
-        role_prefix = SAFETY_ROLES.get(model)
-        
-        if not role_prefix:
-            # Check for ChatGPT variants
-            if "openai/" in model.lower() and ("chatgpt" in model.lower() or "gpt" in model.lower()):
-                role_prefix = CHATGPT_ROLE
-            # Check for Mistral variants
-            elif "mistral" in model.lower():
-                role_prefix = MISTRAL_ROLE
-        
-        content = f"{role_prefix}\n\n{user_query}" if role_prefix else user_query
-        messages = [{"role": "user", "content": content}]
-        tasks.append(query_model(model, messages))
-
-    responses = await asyncio.gather(*tasks)
-
+        role_prefix = _ROLE_PREFIX_CACHE.get(model)
+        content = by_prefix.get(role_prefix)
+        if content is None:
+            content = f"{role_prefix}\n\n{user_query}" if role_prefix else user_query
+            by_prefix[role_prefix] = content
+        contents[model] = content
+    return contents
+
+
+def _assemble_stage1(
+    responses: Dict[str, Optional[Dict[str, Any]]],
+) -> Tuple[List[Dict[str, Any]], List[CouncilMember]]:
+    """Create CouncilMember objects and Stage 1 results for every model that responded."""
     council_members: List[CouncilMember] = []
     stage1_results: List[Dict[str, Any]] = []
 
     member_id_counter = 0
-    for model, resp in zip(COUNCIL_MODELS, responses):
+    for model in COUNCIL_MODELS:
+        resp = responses.get(model)
         if resp is None:
             continue
 
@@ -142,14 +293,14 @@ async def stage1_collect_responses(user_query: str) -> Tuple[List[Dict[str, Any]
         member = CouncilMember(
             id=member_id,
             model=model,
-            role=get_governance_role(model),
+            role=_ROLE_CACHE[model],
         )
         council_members.append(member)
 
         stage1_results.append({
             "member_id": member.id,
             "model": model,
-            "response": resp.get("content", ""),
+            "response": resp.get("content") or "",
         })
 
     return stage1_results, council_members
@@ -159,6 +310,7 @@ async def stage1_collect_responses(user_query: str) -> Tuple[List[Dict[str, Any]
 # Stage 1.5: Delphi reflection
 # =========================
 
+@disk_cached("stage1_5")
 async def stage1_5_delphi_reflection(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
@@ -173,18 +325,122 @@ async def stage1_5_delphi_reflection(
       delphi_results: [{member_id, model, round1_response, round2_response, decision, revision_reason, has_material_disagreement}]
       needs_human_review: bool
     """
-    tasks = []
-    for i, (member, result) in enumerate(zip(council_members, stage1_results)):
-        peer_responses = [r["response"] for j, r in enumerate(stage1_results) if j != i]
-        digest = _create_peer_digest(peer_responses)
+    build_digest = _make_digest_builder([r["response"] for r in stage1_results])
+
+    tasks = [
+        query_model(
+            member.model,
+            _reflection_messages(user_query, result["response"], build_digest(i)),
+            timeout=180.0,
+        )
+        if _is_substantive(result["response"]) else _skip_reflection()
+        for i, (member, result) in enumerate(zip(council_members, stage1_results))
+    ]
+    responses = await asyncio.gather(*tasks)
 
-        reflection_prompt = f"""You are participating in a Delphi-style governance council deliberation.
+    return _collect_delphi_results(council_members, stage1_results, responses)
+
+
+async def stage1_with_delphi_pipeline(
+    user_query: str,
+) -> Tuple[List[Dict[str, Any]], List[CouncilMember], "asyncio.Task[Tuple[List[Dict[str, Any]], bool]]"]:
+    """
+    Stage 1 with progressive Delphi reflection (Stage 1.5) instead of two barriers.
+
+    Each member starts its reflection as soon as its own Stage 1 answer is in and
+    DELPHI_PEER_QUORUM of its peers have answered (or DELPHI_QUORUM_TIMEOUT seconds
+    pass), so the slowest model no longer delays everyone's reflection. The digest
+    covers whichever peers had answered at that moment.
+
+    Returns once Stage 1 is complete, while reflections may still be running:
+      stage1_results, council_members,
+      delphi_task: resolves to (delphi_results, needs_human_review)
+    """
+    round1: Dict[str, Optional[Dict[str, Any]]] = {}
+    features: Dict[str, DigestFeatures] = {}
+    reflections: Dict[str, "asyncio.Task[Optional[Dict[str, Any]]]"] = {}
+    quorum_met = {model: asyncio.Event() for model in COUNCIL_MODELS}
+    peer_quorum = math.ceil(DELPHI_PEER_QUORUM * (len(COUNCIL_MODELS) - 1))
+
+    def quorum_reached(model: str) -> bool:
+        if len(round1) == len(COUNCIL_MODELS):
+            return True
+        answered = sum(1 for m, r in round1.items() if m != model and r is not None)
+        return answered >= peer_quorum
+
+    async def reflect(model: str) -> Optional[Dict[str, Any]]:
+        await quorum_met[model].wait()
+        digest = _format_peer_digest([features[m] for m in COUNCIL_MODELS if m != model and m in features])
+        messages = _reflection_messages(user_query, round1[model].get("content") or "", digest)
+        return await query_model(model, messages, timeout=180.0)
+
+    def on_response(model: str, resp: Optional[Dict[str, Any]]):
+        round1[model] = resp
+        if resp is not None:
+            content = resp.get("content") or ""
+            features[model] = _digest_features(content)
+            if _is_substantive(content):
+                # A timer rather than wait_for(): on Python 3.10, wait_for() swallows a
+                # cancellation that arrives as the event is set, leaving the reflection running
+                asyncio.get_running_loop().call_later(DELPHI_QUORUM_TIMEOUT, quorum_met[model].set)
+                reflections[model] = asyncio.create_task(reflect(model))
+        for m, event in quorum_met.items():
+            if not event.is_set() and quorum_reached(m):
+                event.set()
+
+    try:
+        stage1_results, council_members = await stage1_collect_responses(user_query, on_response)
+    except BaseException:
+        _cancel_pending(reflections.values())
+        raise
+
+    # No more peers are coming (stragglers past the Stage 1 quorum grace were dropped)
+    for event in quorum_met.values():
+        event.set()
+
+    async def finish_delphi() -> Tuple[List[Dict[str, Any]], bool]:
+        responses = await asyncio.gather(*[
+            reflections.get(m.model) or _skip_reflection() for m in council_members
+        ])
+        return _collect_delphi_results(council_members, stage1_results, responses)
+
+    delphi_task = asyncio.create_task(finish_delphi())
+    # If the caller abandons Stage 1.5 (even before finish_delphi starts), stop the reflections too
+    delphi_task.add_done_callback(lambda _: _cancel_pending(reflections.values()))
+    return stage1_results, council_members, delphi_task
+
+
+def _cancel_pending(tasks: Iterable["asyncio.Task[Any]"]):
+    """Cancel every task that has not finished yet."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+
+
+# Round-1 answers too thin to be worth a reflection call
+_MIN_SUBSTANTIVE_CHARS = 200
+_REFUSAL_RE = re.compile(r"^\s*(i'm sorry|i cannot|as an ai)", re.IGNORECASE)
+
+
+def _is_substantive(response: str) -> bool:
+    """Whether a Stage 1 response is worth sending to the Delphi reflection round."""
+    return len(response) >= _MIN_SUBSTANTIVE_CHARS and not _REFUSAL_RE.search(response)
+
+
+async def _skip_reflection() -> None:
+    """Placeholder for members whose reflection call was skipped."""
+    return None
+
+
+def _reflection_messages(user_query: str, round1_response: str, digest: str) -> List[Dict[str, str]]:
+    """Build the Delphi reflection prompt for one council member."""
+    reflection_prompt = f"""You are participating in a Delphi-style governance council deliberation.
 
 ORIGINAL QUESTION:
 {user_query}
 
 YOUR INITIAL RESPONSE (Round 1):
-{result['response']}
+{round1_response}
 
 ANONYMIZED PEER FEEDBACK:
 {digest}
@@ -209,18 +465,33 @@ DISSENT: <one sentence>
 
 Be explicit about any remaining disagreements with peers. If you strongly disagree on a high-risk recommendation, state it clearly.
 """
+    return [{"role": "user", "content": reflection_prompt}]
 
-        messages = [{"role": "user", "content": reflection_prompt}]
-        tasks.append(query_model(member.model, messages, timeout=180.0))
-
-    responses = await asyncio.gather(*tasks)
 
+def _collect_delphi_results(
+    council_members: List[CouncilMember],
+    stage1_results: List[Dict[str, Any]],
+    responses: List[Optional[Dict[str, Any]]],
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Parse reflection responses into Delphi results and the human-review signal."""
     delphi_results: List[Dict[str, Any]] = []
     material_disagreements: List[Dict[str, Any]] = []
 
     for member, round1, resp in zip(council_members, stage1_results, responses):
         round1_text = round1["response"]
 
+        if not _is_substantive(round1_text):
+            delphi_results.append({
+                "member_id": member.id,
+                "model": member.model,
+                "round1_response": round1_text,
+                "round2_response": round1_text,
+                "decision": "AFFIRM",
+                "revision_reason": "Skipped: insubstantial round-1 response",
+                "has_material_disagreement": False,
+            })
+            continue
+
         if resp is None:
             delphi_results.append({
                 "member_id": member.id,
@@ -233,7 +504,7 @@ Be explicit about any remaining disagreements with peers. If you strongly disagr
             })
             continue
 
-        response_text = resp.get("content", "")
+        response_text = resp.get("content") or ""
         decision, justification, final_response = _parse_delphi_response(response_text)
 
         has_disagreement = _detect_material_disagreement(response_text)
@@ -267,95 +538,241 @@ Be explicit about any remaining disagreements with peers. If you strongly disagr
 # Helpers: Delphi digest + parsing
 # =========================
 
-def _create_peer_digest(peer_responses: List[str]) -> str:
-    """Create an anonymized digest of peer responses."""
-    if not peer_responses:
+# Keyword sets are compiled into single alternation patterns so each text is
+# scanned once in C instead of once per keyword.
+
+def _keyword_pattern(keywords: Tuple[str, ...], flags: int = 0) -> "re.Pattern[str]":
+    """Compile literal keywords into one alternation pattern."""
+    return re.compile("|".join(re.escape(k) for k in keywords), flags)
+
+
+RISK_KEYWORDS = ("risk", "danger", "leak", "privacy", "security")
+ACTION_KEYWORDS = ("recommend", "should", "plan", "steps", "phase")
+DIVERGENCE_KEYWORDS = ("disagree", "however", "but", "trade-off", "tension")
+
+EXPLICIT_DISSENT_PHRASES = (
+    "strongly disagree", "fundamental disagreement", "cannot support",
+    "oppose", "dangerous recommendation", "significant divergence",
+    "dissent:", "high-stakes", "human decision required",
+)
+
+HIGH_RISK_TRIGGERS = (
+    # retroactive / forensic actions
+    "forensic", "audit past", "export chat", "browser logs", "chat histories",
+    "breach notification", "gdpr", "ccpa", "hipaa", "regulator",
+
+    # extreme enforcement
+    "ban all", "block all", "zero tolerance",
+
+    # risky tech posture
+    "self-host", "open-source model", "run locally", "deploy llama",
+    "local model", "on-prem model",
+)
+
+DISAGREEMENT_SUMMARY_KEYWORDS = ("dissent", "disagree", "concern", "risk", "oppose", "forensic", "breach")
+
+_RE_RISK = _keyword_pattern(RISK_KEYWORDS)
+_RE_ACTION = _keyword_pattern(ACTION_KEYWORDS)
+_RE_DIVERGENCE = _keyword_pattern(DIVERGENCE_KEYWORDS)
+# Explicit dissent and high-risk triggers escalate alike, so scan for both at once
+MATERIAL_DISAGREEMENT_TRIGGERS = EXPLICIT_DISSENT_PHRASES + HIGH_RISK_TRIGGERS
+_RE_MATERIAL_DISAGREEMENT = _keyword_pattern(MATERIAL_DISAGREEMENT_TRIGGERS)
+_RE_DISAGREEMENT_SUMMARY = _keyword_pattern(DISAGREEMENT_SUMMARY_KEYWORDS, re.IGNORECASE)
+
+
+# (pattern, digest line) for each peer theme, in display order
+_DIGEST_THEMES = (
+    (_RE_RISK, "• Multiple peers mention risk/safety concerns"),
+    (_RE_ACTION, "• Peers provide actionable recommendations"),
+    (_RE_DIVERGENCE, "• Divergence in perspectives noted"),
+)
+
+
+# Per-response digest inputs: (truncated summary, theme flags in _DIGEST_THEMES order)
+DigestFeatures = Tuple[str, Tuple[bool, ...]]
+
+
+def _digest_features(response: str) -> DigestFeatures:
+    """Summarize and theme-scan one response (lowercased exactly once)."""
+    summary = response[:220].strip()
+    if len(response) > 220:
+        summary += "..."
+
+    text = response.lower()
+    themes = tuple(bool(pattern.search(text)) for pattern, _ in _DIGEST_THEMES)
+    return summary, themes
+
+
+def _format_peer_digest(peers: List[DigestFeatures]) -> str:
+    """Create an anonymized digest from the peers' precomputed features."""
+    if not peers:
         return "No peer responses available."
 
     digest_parts = ["PEER RESPONSE SUMMARY:"]
-    for i, response in enumerate(peer_responses, 1):
-        summary = response[:220].strip()
-        if len(response) > 220:
-            summary += "..."
-        digest_parts.append(f"• Peer {i}: {summary}")
+    for n, (summary, _) in enumerate(peers, 1):
+        digest_parts.append(f"• Peer {n}: {summary}")
 
     digest_parts.append("\nKEY THEMES:")
-    all_text = " ".join(peer_responses).lower()
-
-    if any(k in all_text for k in ["risk", "danger", "leak", "privacy", "security"]):
-        digest_parts.append("• Multiple peers mention risk/safety concerns")
-    if any(k in all_text for k in ["recommend", "should", "plan", "steps", "phase"]):
-        digest_parts.append("• Peers provide actionable recommendations")
-    if any(k in all_text for k in ["disagree", "however", "but", "trade-off", "tension"]):
-        digest_parts.append("• Divergence in perspectives noted")
+    for t, (_, line) in enumerate(_DIGEST_THEMES):
+        if any(themes[t] for _, themes in peers):
+            digest_parts.append(line)
 
     return "\n".join(digest_parts)
 
 
+def _make_digest_builder(all_responses: List[str]) -> Callable[..., str]:
+    """
+    Prepare anonymized peer digests for every council member at once.
+
+    Each response is summarized and scanned for themes exactly once; the returned
+    builder assembles a member's digest from everyone else's precomputed parts.
+    """
+    features = [_digest_features(response) for response in all_responses]
+
+    def build(exclude_index: Optional[int] = None) -> str:
+        return _format_peer_digest([f for i, f in enumerate(features) if i != exclude_index])
+
+    return build
+
+
 def _parse_delphi_response(response_text: str) -> Tuple[str, str, str]:
     """Parse Delphi reflection response: (decision, justification, final_response)."""
-    decision_match = re.search(r"DECISION:\s*\[?(REVISE|AFFIRM)\]?", response_text, re.IGNORECASE)
+    decision_match = _RE_DECISION.search(response_text)
     decision = decision_match.group(1).upper() if decision_match else "AFFIRM"
 
-    justification_match = re.search(
-        r"JUSTIFICATION.*?:\s*(.*?)(?=FINAL RESPONSE:|$)",
-        response_text,
-        re.DOTALL | re.IGNORECASE,
-    )
+    justification_match = _RE_JUSTIFICATION.search(response_text)
     justification = justification_match.group(1).strip() if justification_match else "No justification provided"
 
-    final_response_match = re.search(
-        r"FINAL RESPONSE:\s*(.*)",
-        response_text,
-        re.DOTALL | re.IGNORECASE,
-    )
+    final_response_match = _RE_FINAL_RESPONSE.search(response_text)
     final_response = final_response_match.group(1).strip() if final_response_match else response_text
 
     return decision, justification[:500], final_response
 
 
+def _compile_trigger_database(keywords: Tuple[str, ...]) -> Optional["hyperscan.Database"]:
+    """Compile literal keywords into a caseless Hyperscan database, if Hyperscan is installed."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(k).encode("utf-8") for k in keywords],
+        ids=list(range(len(keywords))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(keywords),
+    )
+    return db
+
+
+_HS_MATERIAL_DISAGREEMENT = _compile_trigger_database(MATERIAL_DISAGREEMENT_TRIGGERS)
+
+
 def _detect_material_disagreement(response_text: str) -> bool:
     """
     Detect if response indicates material disagreement OR high-stakes triggers,
     even without explicit dissent phrasing.
     """
-    text = response_text.lower()
+    if _HS_MATERIAL_DISAGREEMENT is not None:
+        matched: List[int] = []
+        _HS_MATERIAL_DISAGREEMENT.scan(
+            response_text.encode("utf-8"),
+            match_event_handler=lambda id_, *_: matched.append(id_),
+        )
+        return bool(matched)
 
-    explicit = [
-        "strongly disagree", "fundamental disagreement", "cannot support",
-        "oppose", "dangerous recommendation", "significant divergence",
-        "dissent:", "high-stakes", "human decision required",
-    ]
+    return _RE_MATERIAL_DISAGREEMENT.search(response_text.lower()) is not None
 
-    high_risk_triggers = [
-        # retroactive / forensic actions
-        "forensic", "audit past", "export chat", "browser logs", "chat histories",
-        "breach notification", "gdpr", "ccpa", "hipaa", "regulator",
 
-        # extreme enforcement
-        "ban all", "block all", "zero tolerance",
+def _extract_disagreement_summary(response_text: str) -> str:
+    """Extract a brief summary of disagreement."""
+    # Keywords never span a sentence break, so the first sentence with a keyword
+    # is the one around the first match; no need to split the whole text.
+    match = _RE_DISAGREEMENT_SUMMARY.search(response_text)
+    if match is None:
+        return "Material disagreement detected"
 
-        # risky tech posture
-        "self-host", "open-source model", "run locally", "deploy llama",
-        "local model", "on-prem model",
-    ]
+    start = max(response_text.rfind(c, 0, match.start()) for c in ".!?") + 1
+    end_match = _RE_SENTENCE_SPLIT.search(response_text, match.end())
+    end = end_match.start() if end_match else len(response_text)
+    return response_text[start:end].strip()[:220]
 
-    return any(p in text for p in explicit) or any(k in text for k in high_risk_triggers)
 
+# =========================
+# Prompt-prefix caching
+# =========================
 
-def _extract_disagreement_summary(response_text: str) -> str:
-    """Extract a brief summary of disagreement."""
-    sentences = re.split(r"[.!?]+", response_text)
-    for s in sentences:
-        if any(w in s.lower() for w in ["dissent", "disagree", "concern", "risk", "oppose", "forensic", "breach"]):
-            return s.strip()[:220]
-    return "Material disagreement detected"
+# Providers that need explicit cache breakpoints (passed through by OpenRouter).
+# OpenAI, Grok and others cache repeated prompt prefixes automatically.
+_EXPLICIT_CACHE_PROVIDERS = ("anthropic/", "google/")
+
+
+def _cacheable_messages(model: str, static_prefix: str, dynamic_suffix: str) -> List[Dict[str, Any]]:
+    """
+    Build a single user message as [stable instructions][per-query content].
+
+    Keeping the instructions first and byte-identical lets providers serve them
+    from their prompt caches; explicit-cache providers get a breakpoint after them.
+    """
+    prefix_part: Dict[str, Any] = {"type": "text", "text": static_prefix}
+    if model.startswith(_EXPLICIT_CACHE_PROVIDERS):
+        prefix_part["cache_control"] = {"type": "ephemeral"}
+
+    return [{
+        "role": "user",
+        "content": [prefix_part, {"type": "text", "text": dynamic_suffix}],
+    }]
+
+
+# =========================
+# Response truncation
+# =========================
+
+_TRUNCATION_MARKER = "\n\n[...truncated...]\n\n"
+
+
+def _budget_truncate(text: str, max_tokens: int = RESPONSE_TOKEN_BUDGET) -> str:
+    """
+    Fit a response into roughly max_tokens (estimated at 4 characters per token).
+
+    Keeps the head (where models state their recommendation) and the tail
+    (their summary / go-no-go), cutting at paragraph breaks where possible.
+    A budget of 0 disables truncation.
+    """
+    max_chars = max_tokens * 4
+    if max_tokens <= 0 or len(text) <= max_chars:
+        return text
+
+    tail_chars = max_chars // 3
+    head = text[:max_chars - tail_chars]
+    tail = text[-tail_chars:]
+
+    head_break = head.rfind("\n\n")
+    if head_break > len(head) // 2:
+        head = head[:head_break]
+    tail_break = tail.find("\n\n")
+    if -1 < tail_break < len(tail) // 2:
+        tail = tail[tail_break:]
+
+    return head.rstrip() + _TRUNCATION_MARKER + tail.lstrip()
 
 
 # =========================
 # Stage 2: Collect rankings
 # =========================
 
+STAGE2_INSTRUCTIONS = """You are evaluating different responses to a question. The question and the anonymized responses follow these instructions.
+
+Your task:
+1) Evaluate each response briefly (strengths + weaknesses).
+2) Then, at the very end, provide a final ranking.
+
+IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
+- Start with the line "FINAL RANKING:" (all caps, with colon)
+- Then list responses from best to worst as a numbered list
+- Each line must be: number, period, space, then ONLY the response label (e.g., "1. Response A")
+- Do not add any extra text in the ranking section
+"""
+
+
+@disk_cached("stage2", store_if=lambda result: bool(result[0]))
 async def stage2_collect_rankings(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
@@ -377,38 +794,29 @@ async def stage2_collect_rankings(
         label_to_model[member.label] = member.model
 
     responses_text = "\n\n".join([
-        f"{member.label}:\n{result['response']}"
+        f"{member.label}:\n{_budget_truncate(result['response'])}"
         for member, result in zip(council_members, stage1_results)
     ])
 
-    ranking_prompt = f"""You are evaluating different responses to the following question:
-
-Question: {user_query}
+    ranking_context = f"""Question: {user_query}
 
 Here are the responses from different models (anonymized):
 
 {responses_text}
 
-Your task:
-1) Evaluate each response briefly (strengths + weaknesses).
-2) Then, at the very end, provide a final ranking.
-
-IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
-- Start with the line "FINAL RANKING:" (all caps, with colon)
-- Then list responses from best to worst as a numbered list
-- Each line must be: number, period, space, then ONLY the response label (e.g., "1. Response A")
-- Do not add any extra text in the ranking section
-
 Now provide your evaluation and ranking:"""
 
-    messages = [{"role": "user", "content": ranking_prompt}]
-    model_responses = await query_models_parallel(COUNCIL_MODELS, messages)
+    tasks = [
+        query_model(model, _cacheable_messages(model, STAGE2_INSTRUCTIONS, ranking_context))
+        for model in COUNCIL_MODELS
+    ]
+    model_responses = dict(zip(COUNCIL_MODELS, await asyncio.gather(*tasks)))
 
     stage2_results: List[Dict[str, Any]] = []
     for model, resp in model_responses.items():
         if resp is None:
             continue
-        full_text = resp.get("content", "")
+        full_text = resp.get("content") or ""
         parsed = parse_ranking_from_text(full_text)
         stage2_results.append({
             "model": model,
@@ -429,6 +837,44 @@ Now provide your evaluation and ranking:"""
 # Stage 3: Chairman synthesis
 # =========================
 
+STAGE3_ERROR_RESPONSE = "Error: Unable to generate final synthesis."
+
+CHAIRMAN_INSTRUCTIONS = """You are the Chairman of an AI Governance Council. Multiple AI models have deliberated on the user's question. The question, their responses and their peer rankings follow these instructions.
+
+You must produce a governance-grade output. Follow this structure exactly:
+
+A) CONSENSUS SUMMARY (3–6 bullets)
+- What do most models agree on?
+
+B) KEY DISSENT (only if present)
+- Where do models materially disagree? Preserve dissent; do NOT force consensus.
+- If dissent involves legal/regulatory exposure, retroactive investigation, or blocking policies, mark it as HIGH-STAKES.
+
+C) 30–60 DAY CONSOLIDATED PLAN (phased)
+- Phase 1 (Days 1–15): immediate containment + safe-harbor rules
+- Phase 2 (Days 15–30): sanctioned tools + minimal policy
+- Phase 3 (Days 30–45): technical boundary controls
+- Phase 4 (Days 45–60): training + monitoring + metrics
+Each phase MUST include: Owner, Action, Output.
+
+D) DECISION BOUNDARIES (when to escalate)
+List clear triggers that require human leadership or counsel. At minimum include:
+- handling regulated data (PII/PHI/PCI) or proprietary IP exposure,
+- retroactive forensic investigation or breach-notification decisions,
+- recommendations that materially increase legal or operational exposure,
+- strong unresolved disagreement after Delphi Round 2.
+
+E) KILL SWITCH / STOP CONDITIONS (fail-safe)
+Define 1–2 conditions under which the organization must PAUSE rollout and activate incident response.
+Include who has authority to trigger the stop and what happens next.
+"""
+
+
+def _stage3_succeeded(result: Dict[str, Any]) -> bool:
+    return result["response"] != STAGE3_ERROR_RESPONSE
+
+
+@disk_cached("stage3", store_if=_stage3_succeeded)
 async def stage3_synthesize_final(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
@@ -441,18 +887,92 @@ async def stage3_synthesize_final(
 
     In Delphi mode, uses Round 2 responses and notes human review needs.
     """
+    messages = _chairman_messages(user_query, stage1_results, stage2_results, delphi_results, needs_human_review)
+    # The user is waiting on this single call, so route it for latency
+    resp = await query_model(CHAIRMAN_MODEL, messages, timeout=180.0, tier="high")
+
+    # A reply with null or empty content is as much a failure as no reply
+    content = (resp.get("content") or None) if resp is not None else None
+    return _stage3_result(content, needs_human_review)
+
+
+async def stage3_synthesize_final_stream(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    delphi_results: Optional[List[Dict[str, Any]]] = None,
+    needs_human_review: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stage 3 with the chairman's synthesis streamed as it is generated.
+
+    Yields {"delta": text} events as tokens arrive, then a single
+    {"result": {...}} event with the same dict stage3_synthesize_final() returns.
+    """
+    # Shares disk cache entries with stage3_synthesize_final()
+    cache_key = None
+    if disk_cache.enabled:
+        cache_key = disk_cache.key({
+            "user_query": user_query,
+            "stage1_results": stage1_results,
+            "stage2_results": stage2_results,
+            "delphi_results": delphi_results,
+            "needs_human_review": needs_human_review,
+        })
+        cached = disk_cache.get("stage3", cache_key)
+        if cached is not None:
+            yield {"result": cached}
+            return
+
+    messages = _chairman_messages(user_query, stage1_results, stage2_results, delphi_results, needs_human_review)
+
+    chunks: List[str] = []
+    # aclosing: if our consumer stops early, the HTTP stream is closed right away
+    try:
+        async with aclosing(query_model_stream(CHAIRMAN_MODEL, messages, timeout=180.0, tier="high")) as stream:
+            async for delta in stream:
+                chunks.append(delta)
+                yield {"delta": delta}
+    except StreamIncomplete as e:
+        # A cut-off synthesis is a failed one: report it as such and never cache it
+        print(f"Chairman synthesis incomplete: {e}")
+        chunks = []
+
+    result = _stage3_result("".join(chunks) if chunks else None, needs_human_review)
+    if cache_key is not None and _stage3_succeeded(result):
+        disk_cache.set("stage3", cache_key, result)
+    yield {"result": result}
+
+
+def _stage3_result(content: Optional[str], needs_human_review: bool) -> Dict[str, Any]:
+    """Wrap the chairman's synthesis (None if the call failed) as a Stage 3 result."""
+    return {
+        "model": CHAIRMAN_MODEL,
+        "response": content if content is not None else STAGE3_ERROR_RESPONSE,
+        "needs_human_review": needs_human_review,
+    }
+
+
+def _chairman_messages(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    delphi_results: Optional[List[Dict[str, Any]]],
+    needs_human_review: bool,
+) -> List[Dict[str, Any]]:
+    """Build the chairman's synthesis prompt (stable instructions first)."""
     if delphi_results:
         synthesis_text = "\n\n".join([
             f"Model: {r['model']}\n"
             f"Decision: {r.get('decision', 'N/A')}\n"
             f"Reason: {r.get('revision_reason', 'N/A')}\n"
-            f"Final Response: {r.get('round2_response', '')}"
+            f"Final Response: {_budget_truncate(r.get('round2_response', ''))}"
             for r in delphi_results
         ])
         mode_context = "After a Delphi reflection round where models reviewed anonymized peer feedback:"
     else:
         synthesis_text = "\n\n".join([
-            f"Model: {r['model']}\nResponse: {r.get('response', '')}"
+            f"Model: {r['model']}\nResponse: {_budget_truncate(r.get('response', ''))}"
             for r in stage1_results
         ])
         mode_context = "Individual responses:"
@@ -462,9 +982,7 @@ async def stage3_synthesize_final(
         for r in stage2_results
     ]) if stage2_results else "No rankings available."
 
-    chairman_prompt = f"""You are the Chairman of an AI Governance Council. Multiple AI models have deliberated on the user's question.
-
-Original Question:
+    chairman_context = f"""Original Question:
 {user_query}
 
 {mode_context}
@@ -472,37 +990,12 @@ Original Question:
 
 PEER RANKINGS:
 {stage2_text}
-
-You must produce a governance-grade output. Follow this structure exactly:
-
-A) CONSENSUS SUMMARY (3–6 bullets)
-- What do most models agree on?
-
-B) KEY DISSENT (only if present)
-- Where do models materially disagree? Preserve dissent; do NOT force consensus.
-- If dissent involves legal/regulatory exposure, retroactive investigation, or blocking policies, mark it as HIGH-STAKES.
-
-C) 30–60 DAY CONSOLIDATED PLAN (phased)
-- Phase 1 (Days 1–15): immediate containment + safe-harbor rules
-- Phase 2 (Days 15–30): sanctioned tools + minimal policy
-- Phase 3 (Days 30–45): technical boundary controls
-- Phase 4 (Days 45–60): training + monitoring + metrics
-Each phase MUST include: Owner, Action, Output.
-
-D) DECISION BOUNDARIES (when to escalate)
-List clear triggers that require human leadership or counsel. At minimum include:
-- handling regulated data (PII/PHI/PCI) or proprietary IP exposure,
-- retroactive forensic investigation or breach-notification decisions,
-- recommendations that materially increase legal or operational exposure,
-- strong unresolved disagreement after Delphi Round 2.
-
-E) KILL SWITCH / STOP CONDITIONS (fail-safe)
-Define 1–2 conditions under which the organization must PAUSE rollout and activate incident response.
-Include who has authority to trigger the stop and what happens next.
 """
 
     if needs_human_review:
-        chairman_prompt += """
+        chairman_context += """
+Also include this section after E:
+
 F) ESCALATE TO HUMAN REVIEW — HUMAN DECISION REQUIRED
 State clearly: "HUMAN DECISION REQUIRED".
 Describe:
@@ -512,42 +1005,73 @@ Describe:
 Use compliance-safe language: do NOT recommend "ignoring" past exposure. Instead describe proportional investigation trade-offs and advise consulting counsel where required.
 """
 
-    chairman_prompt += "\nProvide your final synthesis now."
-
-    messages = [{"role": "user", "content": chairman_prompt}]
-    resp = await query_model(CHAIRMAN_MODEL, messages, timeout=180.0)
+    chairman_context += "\nProvide your final synthesis now."
 
-    if resp is None:
-        return {
-            "model": CHAIRMAN_MODEL,
-            "response": "Error: Unable to generate final synthesis.",
-            "needs_human_review": needs_human_review,
-        }
-
-    return {
-        "model": CHAIRMAN_MODEL,
-        "response": resp.get("content", ""),
-        "needs_human_review": needs_human_review,
-    }
+    return _cacheable_messages(CHAIRMAN_MODEL, CHAIRMAN_INSTRUCTIONS, chairman_context)
 
 
 # =========================
 # Ranking parsing + aggregation
 # =========================
 
+_RANKING_MARKER = "FINAL RANKING:"
+_LABEL_PREFIX = "Response "
+_LABEL_PREFIX_LEN = len(_LABEL_PREFIX)
+
+
+def _is_list_item(text: str, pos: int, start: int) -> bool:
+    """True if the label at pos follows a list number such as "1. " (looking no further back than start)."""
+    i = pos - 1
+    while i >= start and text[i].isspace():
+        i -= 1
+    if i < start or text[i] != ".":
+        return False
+    return i - 1 >= start and text[i - 1].isdecimal()
+
+
+def _scan_labels(text: str, start: int, end: int) -> Tuple[List[str], List[str]]:
+    """
+    Collect "Response X" labels (X in A-Z) from text[start:end] in one walk.
+
+    Jumps between occurrences with str.find rather than running a regex over
+    every character, so the cost scales with the number of labels.
+
+    Returns:
+      (numbered, labels): labels that follow a list number such as "1. ", and all labels
+    """
+    numbered: List[str] = []
+    labels: List[str] = []
+    letter_offset = _LABEL_PREFIX_LEN
+
+    pos = text.find(_LABEL_PREFIX, start, end)
+    while pos != -1:
+        letter_at = pos + letter_offset
+        if letter_at < end and "A" <= text[letter_at] <= "Z":
+            label = text[pos:letter_at + 1]
+            labels.append(label)
+            if _is_list_item(text, pos, start):
+                numbered.append(label)
+            pos = text.find(_LABEL_PREFIX, letter_at + 1, end)
+        else:
+            pos = text.find(_LABEL_PREFIX, pos + 1, end)
+
+    return numbered, labels
+
+
 def parse_ranking_from_text(ranking_text: str) -> List[str]:
     """Parse the FINAL RANKING section from a model's evaluation text."""
-    if "FINAL RANKING:" in ranking_text:
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            numbered = re.findall(r"\d+\.\s*Response [A-Z]", ranking_section)
-            if numbered:
-                return [re.search(r"Response [A-Z]", m).group() for m in numbered]
-            matches = re.findall(r"Response [A-Z]", ranking_section)
-            return matches
+    marker = ranking_text.find(_RANKING_MARKER)
+    if marker == -1:
+        return _scan_labels(ranking_text, 0, len(ranking_text))[1]
+
+    start = marker + len(_RANKING_MARKER)
+    end = ranking_text.find(_RANKING_MARKER, start)
+    if end == -1:
+        end = len(ranking_text)
 
-    return re.findall(r"Response [A-Z]", ranking_text)
+    # Prefer the numbered list; fall back to every label in the section
+    numbered, labels = _scan_labels(ranking_text, start, end)
+    return numbered or labels
 
 
 def calculate_aggregate_rankings(
@@ -555,34 +1079,30 @@ def calculate_aggregate_rankings(
     response_mapping: Dict[str, Dict[str, str]],
 ) -> List[Dict[str, Any]]:
     """Calculate aggregate rankings across all models (lower avg rank is better)."""
-    model_positions = defaultdict(list)
+    model_to_role = {m["model"]: m.get("role", "Council Member") for m in response_mapping.values()}
+
+    # model -> [sum of positions, number of rankings]
+    totals: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
 
     for ranking in stage2_results:
         parsed = ranking.get("parsed_ranking") or parse_ranking_from_text(ranking.get("ranking", ""))
         for position, label in enumerate(parsed, start=1):
-            response_id = label.replace("Response ", "").strip()
-            if response_id in response_mapping:
-                model_name = response_mapping[response_id]["model"]
-                model_positions[model_name].append(position)
-
-    aggregate = []
-    for model, positions in model_positions.items():
-        if not positions:
-            continue
-        avg_rank = sum(positions) / len(positions)
-
-        role = "Council Member"
-        for resp_id, mapping in response_mapping.items():
-            if mapping["model"] == model:
-                role = mapping.get("role", role)
-                break
-
-        aggregate.append({
+            mapping = response_mapping.get(label[_LABEL_PREFIX_LEN:].strip())
+            if mapping is not None:
+                total = totals[mapping["model"]]
+                total[0] += position
+                total[1] += 1
+
+    aggregate = [
+        {
             "model": model,
-            "role": role,
-            "average_rank": round(avg_rank, 2),
-            "rankings_count": len(positions),
-        })
+            "role": model_to_role.get(model, "Council Member"),
+            "average_rank": round(position_sum / count, 2),
+            "rankings_count": count,
+        }
+        for model, (position_sum, count) in totals.items()
+        if count
+    ]
 
     aggregate.sort(key=lambda x: x["average_rank"])
     return aggregate
@@ -594,6 +1114,15 @@ def calculate_aggregate_rankings(
 
 async def generate_conversation_title(user_query: str) -> str:
     """Generate a short title for the conversation based on the first user message."""
+    # Too short to summarize; not worth an API call
+    if len(user_query.strip()) < 10:
+        return "New Conversation"
+
+    key = title_key(user_query)
+    cached = title_cache.get(key)
+    if cached is not None:
+        return cached
+
     title_prompt = f"""Generate a very short title (3-5 words maximum) that summarizes the following question.
 The title should be concise and descriptive. Do not use quotes or punctuation in the title.
 
@@ -607,9 +1136,11 @@ Title:"""
     if resp is None:
         return "New Conversation"
 
-    title = resp.get("content", "New Conversation").strip().strip("\"'")
+    title = (resp.get("content") or "New Conversation").strip().strip("\"'")
     if len(title) > 50:
         title = title[:47] + "..."
+
+    title_cache.set(key, title)
     return title
 
 
@@ -617,26 +1148,75 @@ Title:"""
 # Full pipeline
 # =========================
 
-async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
+async def run_full_council(user_query: str) -> AsyncIterator[Dict[str, Any]]:
     """
-    Run the complete council process.
+    Run the complete council process, yielding an event as each stage progresses.
 
     If DELPHI_MODE is enabled, includes Stage 1.5 (reflection round).
+    Repeated (or near-identical) questions are served from the response cache.
+
+    Events (dicts with a "type" key, in order):
+      stage1_start, stage1_complete {data}
+      stage1_5_start, stage1_5_complete {data, metadata}   (Delphi mode only)
+      stage2_start, stage2_complete {data, metadata}
+      stage3_start {data: {model}}, stage3_delta {data}*, stage3_complete {data}
+      result {data: {stage1, stage2, stage3, metadata}}    (always last)
     """
-    stage1_results, council_members = await stage1_collect_responses(user_query)
-
-    if not stage1_results:
-        return [], [], {"model": "error", "response": "All models failed to respond. Please try again."}, {}
+    if RESPONSE_CACHE_ENABLED:
+        cached = response_cache.lookup(user_query)
+        if cached is not None:
+            stage1_results, stage2_results, stage3_result, metadata = cached
+            metadata = {**metadata, "cache_hit": True}
+
+            yield {"type": "stage1_complete", "data": stage1_results}
+            if metadata["delphi_results"]:
+                yield {
+                    "type": "stage1_5_complete",
+                    "data": metadata["delphi_results"],
+                    "metadata": {"needs_human_review": metadata["needs_human_review"]},
+                }
+            yield {"type": "stage2_complete", "data": stage2_results, "metadata": metadata}
+            yield {"type": "stage3_complete", "data": stage3_result}
+            yield _result_event(stage1_results, stage2_results, stage3_result, metadata)
+            return
 
     delphi_results = None
     needs_human_review = False
 
-    if DELPHI_MODE:
-        delphi_results, needs_human_review = await stage1_5_delphi_reflection(
-            user_query,
-            stage1_results,
-            council_members,
-        )
+    delphi_task = None
+    try:
+        yield {"type": "stage1_start"}
+        if DELPHI_MODE and not disk_cache.enabled:
+            # Reflection rounds start per member as Stage 1 answers arrive
+            stage1_results, council_members, delphi_task = await stage1_with_delphi_pipeline(user_query)
+        else:
+            # With the stage cache on, reflect only after Stage 1 so the round can be
+            # looked up by the complete set of Stage 1 answers
+            stage1_results, council_members = await stage1_collect_responses(user_query)
+            if DELPHI_MODE:
+                delphi_task = asyncio.create_task(
+                    stage1_5_delphi_reflection(user_query, stage1_results, council_members)
+                )
+        yield {"type": "stage1_complete", "data": stage1_results}
+
+        if DELPHI_MODE:
+            yield {"type": "stage1_5_start"}
+            delphi_results, needs_human_review = await delphi_task
+            yield {
+                "type": "stage1_5_complete",
+                "data": delphi_results,
+                "metadata": {"needs_human_review": needs_human_review},
+            }
+    finally:
+        # Closed or cancelled before the reflections were collected: don't leave them running
+        if delphi_task is not None:
+            delphi_task.cancel()
+
+    if not stage1_results:
+        stage3_result = {"model": "error", "response": "All models failed to respond. Please try again."}
+        yield {"type": "stage3_complete", "data": stage3_result}
+        yield _result_event([], [], stage3_result, {})
+        return
 
     ranking_input = stage1_results
     if DELPHI_MODE and delphi_results:
@@ -649,6 +1229,7 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
             for r in delphi_results
         ]
 
+    yield {"type": "stage2_start"}
     stage2_results, mapping_metadata = await stage2_collect_rankings(
         user_query,
         ranking_input,
@@ -658,14 +1239,6 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
     response_mapping = mapping_metadata["response_mapping"]
     aggregate_rankings = calculate_aggregate_rankings(stage2_results, response_mapping)
 
-    stage3_result = await stage3_synthesize_final(
-        user_query,
-        stage1_results,
-        stage2_results,
-        delphi_results=delphi_results,
-        needs_human_review=needs_human_review,
-    )
-
     metadata = {
         "council_members": mapping_metadata["council_members"],
         "response_mapping": response_mapping,
@@ -674,6 +1247,67 @@ async def run_full_council(user_query: str) -> Tuple[List, List, Dict, Dict]:
         "delphi_mode": DELPHI_MODE,
         "delphi_results": delphi_results if DELPHI_MODE else None,
         "needs_human_review": needs_human_review,
+        "cache_hit": False,
     }
+    yield {"type": "stage2_complete", "data": stage2_results, "metadata": metadata}
+
+    yield {"type": "stage3_start", "data": {"model": CHAIRMAN_MODEL}}
+    stage3_result = None
+    synthesis = stage3_synthesize_final_stream(
+        user_query,
+        stage1_results,
+        stage2_results,
+        delphi_results=delphi_results,
+        needs_human_review=needs_human_review,
+    )
+    async with aclosing(synthesis):
+        async for event in synthesis:
+            if "delta" in event:
+                yield {"type": "stage3_delta", "data": event["delta"]}
+            else:
+                stage3_result = event["result"]
+    yield {"type": "stage3_complete", "data": stage3_result}
+
+    # Only cache complete deliberations; degraded runs should be retried next time
+    if (
+        RESPONSE_CACHE_ENABLED
+        and len(council_members) == len(COUNCIL_MODELS)
+        and stage2_results
+        and stage3_result["response"] != STAGE3_ERROR_RESPONSE
+    ):
+        response_cache.store(user_query, (stage1_results, stage2_results, stage3_result, metadata))
+
+    yield _result_event(stage1_results, stage2_results, stage3_result, metadata)
+
+
+def _result_event(
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    stage3_result: Dict[str, Any],
+    metadata: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Final run_full_council() event carrying the complete council output."""
+    return {
+        "type": "result",
+        "data": {
+            "stage1": stage1_results,
+            "stage2": stage2_results,
+            "stage3": stage3_result,
+            "metadata": metadata,
+        },
+    }
+
+
+async def collect_council_result(user_query: str) -> Tuple[List, List, Dict, Dict]:
+    """
+    Run the complete council process and return only the final output.
+
+    Returns:
+      (stage1_results, stage2_results, stage3_result, metadata)
+    """
+    async for event in run_full_council(user_query):
+        if event["type"] == "result":
+            result = event["data"]
+            return result["stage1"], result["stage2"], result["stage3"], result["metadata"]
 
-    return stage1_results, stage2_results, stage3_result, metadata
+    raise RuntimeError("Council run ended without a result")
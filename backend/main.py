@@ -2,18 +2,46 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any
+from contextlib import asynccontextmanager
 import uuid
 import json
 import asyncio
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding at the HTTP boundary
+    orjson = None
+
 from . import storage
-from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage1_5_delphi_reflection, stage2_collect_rankings, stage3_synthesize_final, calculate_aggregate_rankings
-from .config import DELPHI_MODE
+from . import openrouter
+from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
+from .council import run_full_council, collect_council_result, generate_conversation_title
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prewarm OpenRouter connections on startup and close the shared client on shutdown."""
+    # The chairman is often also a council member; warm each route once
+    warmup_task = asyncio.create_task(openrouter.prewarm(list(dict.fromkeys([*COUNCIL_MODELS, CHAIRMAN_MODEL]))))
+    yield
+    warmup_task.cancel()
+    await openrouter.aclose()
+
+
+app = FastAPI(
+    title="LLM Governance Council API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
+
 
-app = FastAPI(title="LLM Governance Council API")
+def sse_event(event: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Event, using orjson when it is installed."""
+    if orjson is not None:
+        return b"data: " + orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+    return f"data: {json.dumps(event)}\n\n".encode("utf-8")
 
 # Enable CORS for local development
 app.add_middleware(
@@ -112,7 +140,7 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
         storage.update_conversation_title(conversation_id, title)
 
     # Run the 3-stage council process
-    stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
+    stage1_results, stage2_results, stage3_result, metadata = await collect_council_result(
         request.content
     )
 
@@ -157,62 +185,35 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
             if is_first_message:
                 title_task = asyncio.create_task(generate_conversation_title(request.content))
 
-            # Stage 1: Collect responses and create CouncilMember objects
-            yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-            stage1_results, council_members = await stage1_collect_responses(request.content)
-            yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
-
-            # Stage 1.5 (Optional): Delphi Reflection Round
-            delphi_results = None
-            needs_human_review = False
-            
-            if DELPHI_MODE:
-                yield f"data: {json.dumps({'type': 'stage1_5_start'})}\n\n"
-                delphi_results, needs_human_review = await stage1_5_delphi_reflection(request.content, stage1_results, council_members)
-                yield f"data: {json.dumps({'type': 'stage1_5_complete', 'data': delphi_results, 'metadata': {'needs_human_review': needs_human_review}})}\n\n"
-            
-            # Prepare input for ranking
-            ranking_input = stage1_results
-            if DELPHI_MODE and delphi_results:
-                ranking_input = [
-                    {"member_id": r["member_id"], "model": r["model"], "response": r["round2_response"]}
-                    for r in delphi_results
-                ]
-
-            # Stage 2: Collect rankings (using CouncilMember objects)
-            yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
-            stage2_results, mapping_metadata = await stage2_collect_rankings(request.content, ranking_input, council_members)
-            council_members_dict = mapping_metadata["council_members"]
-            response_mapping = mapping_metadata["response_mapping"]
-            label_to_model = mapping_metadata["label_to_model"]
-            aggregate_rankings = calculate_aggregate_rankings(stage2_results, response_mapping)
-            yield f"data: {json.dumps({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'council_members': council_members_dict, 'response_mapping': response_mapping, 'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings, 'delphi_mode': DELPHI_MODE}})}\n\n"
-
-            # Stage 3: Synthesize final answer
-            yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
-            stage3_result = await stage3_synthesize_final(request.content, stage1_results, stage2_results, delphi_results=delphi_results, needs_human_review=needs_human_review)
-            yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
+            # Forward council progress as it happens: stage results, Delphi progress
+            # and the chairman's synthesis token by token
+            result = None
+            async for event in run_full_council(request.content):
+                if event["type"] == "result":
+                    result = event["data"]
+                else:
+                    yield sse_event(event)
 
             # Wait for title generation if it was started
             if title_task:
                 title = await title_task
                 storage.update_conversation_title(conversation_id, title)
-                yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
+                yield sse_event({'type': 'title_complete', 'data': {'title': title}})
 
             # Save complete assistant message
             storage.add_assistant_message(
                 conversation_id,
-                stage1_results,
-                stage2_results,
-                stage3_result
+                result["stage1"],
+                result["stage2"],
+                result["stage3"]
             )
 
             # Send completion event
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            yield sse_event({'type': 'complete'})
 
         except Exception as e:
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         event_generator(),
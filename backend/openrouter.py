@@ -1,81 +1,484 @@
 """OpenRouter API client for making LLM requests."""
 
+import asyncio
+import hashlib
+import importlib.util
+import json
+import random
+import time
 import httpx
-from typing import List, Dict, Any, Optional
-from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+from contextlib import aclosing
+from typing import List, Dict, Any, Optional, AsyncIterator
+from .config import (
+    OPENROUTER_API_KEY,
+    OPENROUTER_API_URL,
+    OPENROUTER_MODELS_URL,
+    COUNCIL_MAX_CONCURRENCY,
+    OPENROUTER_MAX_RETRIES,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_RESET,
+)
+from .cache import disk_cache
+
+# Rate limits and transient upstream failures worth retrying
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# Upper bound for any single backoff wait, in seconds
+MAX_RETRY_DELAY = 30.0
+
+# Shared across every stage so the whole pipeline respects one concurrency cap
+_semaphore: Optional[asyncio.Semaphore] = None
+_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class StreamIncomplete(Exception):
+    """A streamed reply broke off after some of it had already been yielded."""
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the request semaphore for the running event loop."""
+    global _semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore is None or _semaphore_loop is not loop:
+        _semaphore = asyncio.Semaphore(COUNCIL_MAX_CONCURRENCY)
+        _semaphore_loop = loop
+    return _semaphore
+
+
+# HTTP/2 multiplexes concurrent council calls over one connection; it needs the
+# optional h2 package (pip install "httpx[http2]"), otherwise HTTP/1.1 keep-alive is used
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# One pooled client for every stage so TCP/TLS setup is paid once, not per call
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=_HTTP2,
+            headers=_request_headers(),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=300),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def prewarm(models: List[str]):
+    """
+    Open pooled connections to OpenRouter and touch each model's route ahead of the first query.
+
+    Fetches /models/{id}/endpoints for every model concurrently; failures are
+    ignored since this is only an optimization.
+    """
+    client = _get_client()
+    await asyncio.gather(
+        *[client.get(f"{OPENROUTER_MODELS_URL}/{model}/endpoints") for model in models],
+        return_exceptions=True,
+    )
+
+
+async def aclose():
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """
+    Seconds to wait before the next attempt.
+
+    Honors Retry-After (seconds) or x-ratelimit-reset (epoch milliseconds) when
+    the response carries them, otherwise uses exponential backoff with jitter.
+    """
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+
+        reset = response.headers.get("x-ratelimit-reset")
+        if reset:
+            try:
+                return min(max(float(reset) / 1000 - time.time(), 0.0), MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+
+    return min(2 ** attempt, MAX_RETRY_DELAY) + random.uniform(0, 1)
+
+
+def _request_headers() -> Dict[str, str]:
+    """Headers sent with every OpenRouter request (set once on the shared client)."""
+    return {
+        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://github.com/Morenazzo/llm-governance-council",
+        "X-Title": "LLM Governance Council",
+    }
+
+
+class ModelBreaker:
+    """
+    Circuit breaker for one model.
+
+    CLOSED: calls go through. After `threshold` consecutive failures it turns
+    OPEN and calls fail fast for `reset_after` seconds, then HALF_OPEN lets a
+    single trial call through: success closes the breaker, failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int = 3, reset_after: float = 30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may be made now."""
+        if self.state == self.CLOSED or self.threshold <= 0:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_after:
+            self.state = self.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def record_abandoned(self):
+        """A call was cancelled before it finished; it says nothing about the model."""
+        if self.state == self.HALF_OPEN:
+            # Let the next call make the trial instead
+            self.state = self.OPEN
+
+
+_breakers: Dict[str, ModelBreaker] = {}
+
+
+def _get_breaker(model: str) -> ModelBreaker:
+    breaker = _breakers.get(model)
+    if breaker is None:
+        breaker = _breakers[model] = ModelBreaker(CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_RESET)
+    return breaker
+
+
+def _record_outcome(model: str, task: "asyncio.Task[Optional[Dict[str, Any]]]"):
+    """Feed a finished request into the model's circuit breaker."""
+    breaker = _get_breaker(model)
+    if task.cancelled():
+        breaker.record_abandoned()
+    elif task.exception() is None and task.result() is not None:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+
+# Identical requests already in flight, keyed by (model, messages) hash; later
+# callers await the first caller's request instead of sending their own
+_inflight: Dict[str, "asyncio.Task[Optional[Dict[str, Any]]]"] = {}
+_inflight_waiters: Dict[str, int] = {}
+_inflight_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+# OpenRouter provider routing per latency tier: "high" is for the single request the
+# user is waiting on (the chairman) and prefers the lowest-latency provider;
+# "standard" keeps OpenRouter's default price/uptime balancing
+PROVIDER_PREFERENCES: Dict[str, Optional[Dict[str, Any]]] = {
+    "standard": None,
+    "high": {"sort": "latency"},
+}
+
+
+def _build_payload(model: str, messages: List[Dict[str, Any]], tier: str) -> Dict[str, Any]:
+    """Chat completion request body for the given latency tier."""
+    payload: Dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+    }
+    provider = PROVIDER_PREFERENCES[tier]
+    if provider is not None:
+        payload["provider"] = provider
+    return payload
+
+
+def _request_key(model: str, messages: List[Dict[str, Any]], tier: str = "standard") -> str:
+    """Stable hash of a completion request."""
+    prompt = json.dumps(messages, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=32).hexdigest()
+    return f"{model}:{digest}" if tier == "standard" else f"{model}:{tier}:{digest}"
 
 
 async def query_model(
     model: str,
-    messages: List[Dict[str, str]],
-    timeout: float = 120.0
+    messages: List[Dict[str, Any]],
+    timeout: float = 120.0,
+    tier: str = "standard",
 ) -> Optional[Dict[str, Any]]:
     """
     Query a single model via OpenRouter API.
 
+    Requests share a global concurrency cap (COUNCIL_MAX_CONCURRENCY), and
+    rate limits, 5xx errors and connection failures are retried with backoff
+    up to OPENROUTER_MAX_RETRIES times. Identical concurrent requests (same
+    model and messages, e.g. the same question sent twice) share one HTTP call;
+    the first caller's timeout applies. When the disk cache is enabled
+    (COUNCIL_CACHE_MODE), successful completions are stored and replayed from it.
+    Models whose circuit breaker is open fail fast without a request.
+
     Args:
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
         messages: List of message dicts with 'role' and 'content'
         timeout: Request timeout in seconds
+        tier: Latency tier from PROVIDER_PREFERENCES ("standard" or "high")
 
     Returns:
         Response dict with 'content' and optional 'reasoning_details', or None if failed
     """
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://github.com/Morenazzo/llm-governance-council",
-        "X-Title": "LLM Governance Council",
-    }
+    global _inflight, _inflight_waiters, _inflight_loop
+    loop = asyncio.get_running_loop()
+    if _inflight_loop is not loop:
+        _inflight = {}
+        _inflight_waiters = {}
+        _inflight_loop = loop
 
-    payload = {
-        "model": model,
-        "messages": messages,
-    }
+    key = _request_key(model, messages, tier)
+    cached = disk_cache.get("completion", key)
+    if cached is not None:
+        return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        if not _get_breaker(model).allow():
+            print(f"Skipping model {model}: circuit breaker open after repeated failures")
+            return None
 
+        task = asyncio.create_task(_query_model_once(model, messages, timeout, tier))
+        task.add_done_callback(lambda t: _record_outcome(model, t))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+        task.add_done_callback(lambda t: _store_completion(key, t))
+
+    # Shielded so one caller giving up doesn't cancel the request for the others;
+    # the request itself is cancelled once its last caller gives up
+    _inflight_waiters[key] = _inflight_waiters.get(key, 0) + 1
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            message = data['choices'][0]['message']
-
-            return {
-                'content': message.get('content'),
-                'reasoning_details': message.get('reasoning_details')
-            }
-
-    except Exception as e:
-        print(f"Error querying model {model}: {e}")
-        return None
-
-
-async def query_models_parallel(
-    models: List[str],
-    messages: List[Dict[str, str]]
-) -> Dict[str, Optional[Dict[str, Any]]]:
+        result = await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if _inflight_waiters[key] == 1:
+            task.cancel()
+        raise
+    finally:
+        _inflight_waiters[key] -= 1
+        if not _inflight_waiters[key]:
+            del _inflight_waiters[key]
+
+    return dict(result) if result is not None else None
+
+
+def _store_completion(key: str, task: "asyncio.Task[Optional[Dict[str, Any]]]"):
+    """Persist a successful completion in the disk cache."""
+    if not task.cancelled() and task.exception() is None and task.result() is not None:
+        disk_cache.set("completion", key, task.result())
+
+
+async def _query_model_once(
+    model: str,
+    messages: List[Dict[str, Any]],
+    timeout: float,
+    tier: str,
+) -> Optional[Dict[str, Any]]:
+    """Send one completion request (with retries); see query_model()."""
+    payload = _build_payload(model, messages, tier)
+
+    for attempt in range(OPENROUTER_MAX_RETRIES + 1):
+        retry_response = None
+        try:
+            async with _get_semaphore():
+                response = await _get_client().post(
+                    OPENROUTER_API_URL,
+                    json=payload,
+                    timeout=httpx.Timeout(timeout, connect=10.0),
+                )
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < OPENROUTER_MAX_RETRIES:
+                retry_response = response
+            else:
+                response.raise_for_status()
+
+                data = response.json()
+                message = data['choices'][0]['message']
+
+                return {
+                    'content': message.get('content'),
+                    'reasoning_details': message.get('reasoning_details')
+                }
+
+        except httpx.ReadTimeout as e:
+            # The model already had the full timeout to answer; don't pay it again
+            print(f"Error querying model {model}: {e}")
+            return None
+
+        except httpx.TransportError as e:
+            if attempt >= OPENROUTER_MAX_RETRIES:
+                print(f"Error querying model {model}: {e}")
+                return None
+
+        except Exception as e:
+            print(f"Error querying model {model}: {e}")
+            return None
+
+        delay = _retry_delay(retry_response, attempt)
+        print(f"Retrying model {model} in {delay:.1f}s (attempt {attempt + 2}/{OPENROUTER_MAX_RETRIES + 1})")
+        await asyncio.sleep(delay)
+
+    return None
+
+
+async def query_model_stream(
+    model: str,
+    messages: List[Dict[str, Any]],
+    timeout: float = 120.0,
+    tier: str = "standard",
+) -> AsyncIterator[str]:
     """
-    Query multiple models in parallel.
+    Query a single model via OpenRouter API, streaming the reply.
+
+    Uses the same concurrency cap, retry policy and circuit breaker as
+    query_model(); retries only happen before the first chunk has been yielded.
 
     Args:
-        models: List of OpenRouter model identifiers
-        messages: List of message dicts to send to each model
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+        messages: List of message dicts with 'role' and 'content'
+        timeout: Request timeout in seconds (per read, not for the whole stream)
+        tier: Latency tier from PROVIDER_PREFERENCES ("standard" or "high")
 
-    Returns:
-        Dict mapping model identifier to response dict (or None if failed)
+    Yields:
+        Content chunks as they arrive. Yields nothing if the request fails
+        before the first chunk.
+
+    Raises:
+        StreamIncomplete: if the reply breaks off after chunks were yielded
+            (timeout, dropped connection, error chunk or no [DONE] marker)
     """
-    import asyncio
+    breaker = _get_breaker(model)
+    if not breaker.allow():
+        print(f"Skipping model {model}: circuit breaker open after repeated failures")
+        return
+
+    started = False
+    try:
+        async with aclosing(_stream_model(model, messages, timeout, tier)) as stream:
+            async for delta in stream:
+                started = True
+                yield delta
+    except StreamIncomplete:
+        breaker.record_failure()
+        raise
+    except (GeneratorExit, asyncio.CancelledError):
+        # Consumer stopped early; only a reply that had started counts as success
+        if started:
+            breaker.record_success()
+        else:
+            breaker.record_abandoned()
+        raise
+
+    if started:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+
+async def _stream_model(
+    model: str,
+    messages: List[Dict[str, Any]],
+    timeout: float,
+    tier: str,
+) -> AsyncIterator[str]:
+    """Stream one completion (with retries); see query_model_stream()."""
+    payload = _build_payload(model, messages, tier)
+    payload["stream"] = True
+
+    started = False
+    for attempt in range(OPENROUTER_MAX_RETRIES + 1):
+        retry_response = None
+        try:
+            async with _get_semaphore():
+                async with _get_client().stream(
+                    "POST",
+                    OPENROUTER_API_URL,
+                    json=payload,
+                    timeout=httpx.Timeout(timeout, connect=10.0),
+                ) as response:
+                    if response.status_code in RETRYABLE_STATUS_CODES and attempt < OPENROUTER_MAX_RETRIES:
+                        retry_response = response
+                    else:
+                        response.raise_for_status()
+
+                        async for line in response.aiter_lines():
+                            # Skip SSE comments (keep-alives) and blank separators
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[len("data:"):].strip()
+                            if data == "[DONE]":
+                                return
+
+                            chunk = json.loads(data)
+                            if "error" in chunk:
+                                raise RuntimeError(chunk["error"])
+
+                            delta = chunk["choices"][0].get("delta", {}).get("content")
+                            if delta:
+                                started = True
+                                yield delta
+
+                        # Closed without [DONE]: the reply may be cut off
+                        if started:
+                            raise StreamIncomplete(f"{model}: stream ended before [DONE]")
+                        return
+
+        except StreamIncomplete:
+            raise
+
+        except httpx.ReadTimeout as e:
+            print(f"Error streaming model {model}: {e}")
+            if started:
+                raise StreamIncomplete(f"{model}: {e}") from e
+            return
 
-    # Create tasks for all models
-    tasks = [query_model(model, messages) for model in models]
+        except httpx.TransportError as e:
+            if started or attempt >= OPENROUTER_MAX_RETRIES:
+                print(f"Error streaming model {model}: {e}")
+                if started:
+                    raise StreamIncomplete(f"{model}: {e}") from e
+                return
 
-    # Wait for all to complete
-    responses = await asyncio.gather(*tasks)
+        except Exception as e:
+            print(f"Error streaming model {model}: {e}")
+            if started:
+                raise StreamIncomplete(f"{model}: {e}") from e
+            return
 
-    # Map models to their responses
-    return {model: response for model, response in zip(models, responses)}
+        delay = _retry_delay(retry_response, attempt)
+        print(f"Retrying model {model} in {delay:.1f}s (attempt {attempt + 2}/{OPENROUTER_MAX_RETRIES + 1})")
+        await asyncio.sleep(delay)
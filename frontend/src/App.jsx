@@ -178,6 +178,22 @@ function App() {
               const messages = [...prev.messages];
               const lastMsg = messages[messages.length - 1];
               lastMsg.loading.stage3 = true;
+              lastMsg.stage3Model = event.data?.model;
+              return { ...prev, messages };
+            });
+            break;
+
+          case 'stage3_delta':
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              // Render the chairman's synthesis as it streams in
+              lastMsg.stage3 = {
+                model: lastMsg.stage3?.model || lastMsg.stage3Model || '',
+                response: (lastMsg.stage3?.response || '') + event.data,
+                needs_human_review: false,
+              };
+              lastMsg.loading.stage3 = false;
               return { ...prev, messages };
             });
             break;
@@ -90,6 +90,11 @@ export default function ChatInterface({
               ) : (
                 <div className="assistant-message">
                   <div className="message-label">LLM Council</div>
+                  {msg.metadata?.cache_hit && (
+                    <div className="cache-hit-notice">
+                      Reused from an earlier council run on the same question (not re-deliberated)
+                    </div>
+                  )}
 
                   {/* Stage 1 */}
                   {msg.loading?.stage1 && (
@@ -9,34 +9,142 @@ This script verifies that:
 4. Mistral's Safety Engineer role is active
 """
 
+import argparse
 import asyncio
+import io
+import logging
+import re
 import sys
 import os
+from types import SimpleNamespace
 
-# Add backend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+logger = logging.getLogger(__name__)
 
-from backend.council import run_full_council
-from backend.config import MISTRAL_MODEL_ID, COUNCIL_MODELS
 
+def load_backend():
+    """
+    Import the backend on demand.
 
-async def test_mistral_integration():
-    """Test Mistral integration with a Shadow AI governance prompt."""
+    Importing this module stays cheap (e.g. during pytest collection); the
+    backend, its config and HTTP client stack load only when a test runs.
+    """
+    from backend import openrouter
+    from backend.cache import disk_cache
+    from backend.council import run_full_council, collect_council_result, STAGE3_ERROR_RESPONSE
+    from backend.config import MISTRAL_MODEL_ID, COUNCIL_MODELS, CHAIRMAN_MODEL, STAGE1_QUORUM
+
+    # Which council models are Mistral variants, computed once
+    mistral_mask = ["mistral" in model.lower() for model in COUNCIL_MODELS]
+
+    return SimpleNamespace(
+        openrouter=openrouter,
+        disk_cache=disk_cache,
+        run_full_council=run_full_council,
+        collect_council_result=collect_council_result,
+        STAGE3_ERROR_RESPONSE=STAGE3_ERROR_RESPONSE,
+        MISTRAL_MODEL_ID=MISTRAL_MODEL_ID,
+        COUNCIL_MODELS=COUNCIL_MODELS,
+        CHAIRMAN_MODEL=CHAIRMAN_MODEL,
+        STAGE1_QUORUM=STAGE1_QUORUM,
+        mistral_mask=mistral_mask,
+        mistral_models={m for m, is_mistral in zip(COUNCIL_MODELS, mistral_mask) if is_mistral},
+    )
+
+
+# Technical controls we expect the synthesis to mention (Mistral's specialty),
+# matched in a single pass over the response text
+TECHNICAL_KEYWORDS = ('gateway', 'dlp', 'logging', 'audit', 'control', 'guardrail')
+_TECHNICAL_KEYWORDS_RE = re.compile("|".join(re.escape(kw) for kw in TECHNICAL_KEYWORDS))
+_KEYWORD_OVERLAP = max(len(kw) for kw in TECHNICAL_KEYWORDS) - 1
+
+
+async def run_council_until_keywords(prompt, run_full_council, stop_early=True):
+    """
+    Run the council, scanning the chairman's synthesis for technical keywords as it streams.
+
+    With stop_early, stops as soon as every keyword has been seen, since nothing
+    after that can change the keyword check, and cancels the rest of the
+    generation. The cut-off synthesis is then neither checked nor cached.
+
+    Returns:
+        (stage1_results, stage3_result, metadata, matched_keywords, stopped_early)
+    """
+    stage1_results, metadata, stage3_result = [], {}, None
+    synthesis = io.StringIO()
+    matched = set()
+    tail = ""
+    stopped_early = False
+
+    council = run_full_council(prompt)
+    try:
+        async for event in council:
+            if event["type"] == "stage1_complete":
+                stage1_results = event["data"]
+            elif event["type"] == "stage2_complete":
+                metadata = event["metadata"]
+            elif event["type"] == "stage3_delta":
+                synthesis.write(event["data"])
+                # Keep the end of the previous chunk so keywords split across chunks still match
+                window = tail + event["data"].lower()
+                matched.update(m.group() for m in _TECHNICAL_KEYWORDS_RE.finditer(window))
+                tail = window[-_KEYWORD_OVERLAP:]
+                if stop_early and len(matched) == len(TECHNICAL_KEYWORDS):
+                    stopped_early = True
+                    break
+            elif event["type"] == "stage3_complete":
+                stage3_result = event["data"]
+    finally:
+        await council.aclose()
+
+    if stage3_result is None:
+        stage3_result = {"response": synthesis.getvalue()}
+    elif not stopped_early:
+        # Cached results arrive whole, without deltas
+        matched.update(m.group() for m in _TECHNICAL_KEYWORDS_RE.finditer(stage3_result["response"].lower()))
+
+    return stage1_results, stage3_result, metadata, matched, stopped_early
+
+
+async def test_mistral_integration(require_mistral: bool = False, backend=None):
+    """
+    Test Mistral integration with a Shadow AI governance prompt.
+
+    Args:
+        require_mistral: Fail if Mistral did not respond even when Stage 1 runs
+            with a quorum (STAGE1_QUORUM < 1.0), where a Mistral reply dropped
+            past the quorum is otherwise only a warning. Without a quorum a
+            missing Mistral response always fails.
+        backend: Backend modules and config from load_backend() (loaded if omitted)
+    """
+    backend = backend or load_backend()
+    council_models = backend.COUNCIL_MODELS
+    mistral_mask = backend.mistral_mask
+
+    # Output is buffered and written in a few batches instead of line by line
+    lines = []
+    log = lines.append
+
+    def flush():
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            lines.clear()
     
-    print("=" * 80)
-    print("LLM Governance Council - Mistral Integration Test")
-    print("=" * 80)
-    print()
+    log("=" * 80)
+    log("LLM Governance Council - Mistral Integration Test")
+    log("=" * 80)
+    log("")
     
     # Display configuration
-    print("Configuration:")
-    print(f"  Mistral Model ID: {MISTRAL_MODEL_ID}")
-    print(f"  Total Council Members: {len(COUNCIL_MODELS)}")
-    print(f"  Council Models:")
-    for i, model in enumerate(COUNCIL_MODELS, 1):
-        marker = " (Mistral)" if "mistral" in model.lower() else ""
-        print(f"    {i}. {model}{marker}")
-    print()
+    log("Configuration:")
+    log(f"  Mistral Model ID: {backend.MISTRAL_MODEL_ID}")
+    log(f"  Total Council Members: {len(council_models)}")
+    log(f"  Council Models:")
+    log("\n".join(
+        f"    {i}. {model}{' (Mistral)' if is_mistral else ''}"
+        for i, (model, is_mistral) in enumerate(zip(council_models, mistral_mask), 1)
+    ))
+    log("")
     
     # Test prompt focused on Shadow AI governance
     test_prompt = (
@@ -45,116 +153,257 @@ async def test_mistral_integration():
         "within 30-60 days."
     )
     
-    print(f"Test Prompt:")
-    print(f"  {test_prompt}")
-    print()
-    print("Running council deliberation...")
-    print("-" * 80)
-    print()
+    log(f"Test Prompt:")
+    log(f"  {test_prompt}")
+    log("")
+    log("Running council deliberation...")
+    log("-" * 80)
+    log("")
+    flush()
     
     try:
-        # Run the full council process
-        stage1_results, stage2_results, stage3_result, metadata = await run_full_council(test_prompt)
+        # Warm connections and model routes before the real calls, unless cached replies will answer them
+        if not backend.disk_cache.readable:
+            await backend.openrouter.prewarm(list(dict.fromkeys([*council_models, backend.CHAIRMAN_MODEL])))
+
+        # Run the full council process, watching the synthesis as it streams.
+        # Stopping early would skip the synthesis disk cache write, so only do it when nothing is cached
+        stage1_results, stage3_result, metadata, matched, stopped_early = await run_council_until_keywords(
+            test_prompt, backend.run_full_council, stop_early=not backend.disk_cache.writable
+        )
         
         # Analyze results
-        print("✅ Council deliberation completed successfully!")
-        print()
+        if stopped_early:
+            log("✅ Council deliberation reached Stage 3 (synthesis stopped once all technical controls appeared)")
+        else:
+            log("✅ Council deliberation completed successfully!")
+        log("")
         
         # Check Stage 1 results
-        print("Stage 1 - Individual Responses:")
+        log("Stage 1 - Individual Responses:")
         mistral_responded = False
         other_models_count = 0
+        responded_models = {r['model'] for r in stage1_results if 'model' in r}
+        role_by_model = {m['model']: m['role'] for m in metadata.get('council_members', [])}
         
-        for member in metadata.get('council_members', []):
-            model_id = member['model']
-            role = member['role']
-            
-            # Find corresponding response
-            response_found = any(
-                r.get('model') == model_id for r in stage1_results
-            )
-            
-            if response_found:
-                if "mistral" in model_id.lower():
+        for model_id, role in role_by_model.items():
+            if model_id in responded_models:
+                if model_id in backend.mistral_models:
                     mistral_responded = True
-                    print(f"  ✅ {model_id} ({role}) - RESPONDED")
+                    log(f"  ✅ {model_id} ({role}) - RESPONDED")
                 else:
                     other_models_count += 1
-                    print(f"  ✅ {model_id} ({role}) - responded")
+                    log(f"  ✅ {model_id} ({role}) - responded")
             else:
-                print(f"  ❌ {model_id} ({role}) - NO RESPONSE (graceful degradation)")
+                log(f"  ❌ {model_id} ({role}) - NO RESPONSE (graceful degradation)")
         
-        print()
+        log("")
+        flush()
         
         # Verify Mistral specifically
         if mistral_responded:
-            print("✅ PASS: Mistral responded successfully")
+            log("✅ PASS: Mistral responded successfully")
             
-            # Check if Mistral has Safety Engineer role
-            mistral_member = next(
-                (m for m in metadata.get('council_members', []) 
-                 if "mistral" in m['model'].lower()),
+            # Check if Mistral has Safety Engineer role (first Mistral model in council order)
+            mistral_role = next(
+                (role_by_model[model] for model, is_mistral in zip(council_models, mistral_mask)
+                 if is_mistral and model in role_by_model),
                 None
             )
             
-            if mistral_member and mistral_member['role'] == "Safety Engineer":
-                print("✅ PASS: Mistral has correct role (Safety Engineer)")
+            if mistral_role == "Safety Engineer":
+                log("✅ PASS: Mistral has correct role (Safety Engineer)")
             else:
-                print(f"⚠️  WARNING: Mistral role is '{mistral_member['role'] if mistral_member else 'N/A'}', expected 'Safety Engineer'")
-        else:
-            print("❌ FAIL: Mistral did not respond")
-            print("   This could be due to:")
-            print("   - Invalid API key")
-            print("   - Model ID not available on OpenRouter")
-            print("   - Rate limiting or timeout")
+                log(f"⚠️  WARNING: Mistral role is '{mistral_role or 'N/A'}', expected 'Safety Engineer'")
+        elif require_mistral or backend.STAGE1_QUORUM >= 1.0:
+            log("❌ FAIL: Mistral did not respond")
+            log("   This could be due to:")
+            log("   - Invalid API key")
+            log("   - Model ID not available on OpenRouter")
+            log("   - Rate limiting or timeout")
             return False
+        else:
+            log(
+                f"⚠️  WARNING: Mistral did not respond (STAGE1_QUORUM={backend.STAGE1_QUORUM}, "
+                "so Stage 1 may have moved on without it; use --require-mistral to fail on this)"
+            )
         
         # Verify other models still work
         if other_models_count > 0:
-            print(f"✅ PASS: {other_models_count} other council members responded (graceful degradation working)")
+            log(f"✅ PASS: {other_models_count} other council members responded (graceful degradation working)")
         else:
-            print("⚠️  WARNING: No other models responded")
+            log("⚠️  WARNING: No other models responded")
         
-        print()
+        log("")
         
+        # Check if synthesis mentions technical controls (Mistral's specialty)
+        found_keywords = [kw for kw in TECHNICAL_KEYWORDS if kw in matched]
+
         # Check Stage 3 final synthesis
-        if stage3_result and stage3_result.get('response'):
-            print("✅ PASS: Stage 3 final synthesis generated successfully")
-            
-            # Check if synthesis mentions technical controls (Mistral's specialty)
-            response_text = stage3_result['response'].lower()
-            technical_keywords = ['gateway', 'dlp', 'logging', 'audit', 'control', 'guardrail']
-            found_keywords = [kw for kw in technical_keywords if kw in response_text]
+        if stopped_early:
+            # The synthesis was cut off on purpose, so only the keyword check applies
+            log(f"✅ PASS: Synthesis stream includes every technical control: {', '.join(found_keywords)}")
+            log("ℹ️  INFO: Synthesis stopped before it finished; completion was not checked")
+        elif (
+            stage3_result
+            and stage3_result.get('response')
+            and stage3_result['response'] != backend.STAGE3_ERROR_RESPONSE
+        ):
+            log("✅ PASS: Stage 3 final synthesis generated successfully")
             
             if found_keywords:
-                print(f"✅ PASS: Final synthesis includes technical controls: {', '.join(found_keywords)}")
+                log(f"✅ PASS: Final synthesis includes technical controls: {', '.join(found_keywords)}")
             else:
-                print("ℹ️  INFO: Final synthesis may not emphasize technical controls")
+                log("ℹ️  INFO: Final synthesis may not emphasize technical controls")
         else:
-            print("❌ FAIL: Stage 3 final synthesis failed")
+            log("❌ FAIL: Stage 3 final synthesis failed")
             return False
         
-        print()
-        print("=" * 80)
-        print("TEST RESULT: ✅ PASSED")
-        print("=" * 80)
-        print()
-        print("Mistral integration is working correctly!")
+        log("")
+        log("=" * 80)
+        log("TEST RESULT: ✅ PASSED")
+        log("=" * 80)
+        log("")
+        log("Mistral integration is working correctly!")
         return True
         
     except Exception as e:
-        print(f"❌ ERROR: {e}")
-        print()
-        print("=" * 80)
-        print("TEST RESULT: ❌ FAILED")
-        print("=" * 80)
-        import traceback
-        traceback.print_exc()
+        log(f"❌ ERROR: {e}")
+        log("")
+        log("=" * 80)
+        log("TEST RESULT: ❌ FAILED")
+        log("=" * 80)
+        flush()
+        logger.exception("Council deliberation failed")
         return False
 
+    finally:
+        flush()
+        await backend.openrouter.aclose()
+
+
+# Suite prompts with a rough estimate of the synthesis length (output tokens)
+SUITE_PROMPTS = [
+    ("Should employees be allowed to paste customer data into public chatbots?", 300),
+    ("Name the three most important controls for approving a new AI vendor.", 400),
+    (
+        "Draft a Minimum Viable Governance policy for Shadow AI with enforceable "
+        "technical guardrails. Focus on practical controls that can be implemented "
+        "within 30-60 days.",
+        1500,
+    ),
+    ("Outline an incident response runbook for a prompt-injection data leak.", 1200),
+    (
+        "Design a 12-month AI governance program for a regulated bank, covering model "
+        "inventory, risk tiering, audit trails, and board reporting.",
+        2500,
+    ),
+]
+
+# Upper bounds (exclusive) of the short / medium bins; everything else is long
+SUITE_BIN_LIMITS = (500, 1500)
+
+
+def bin_prompts(prompts):
+    """Split (prompt, est_out_tokens) pairs into short, medium and long bins."""
+    bins = [[], [], []]
+    for prompt, est_tokens in prompts:
+        index = sum(est_tokens >= limit for limit in SUITE_BIN_LIMITS)
+        bins[index].append(prompt)
+    return bins
+
+
+async def run_suite(prompts=SUITE_PROMPTS, max_concurrency=8, backend=None):
+    """
+    Run the council on several prompts, one length bin at a time.
+
+    Prompts with similar expected output length run concurrently, so a long
+    synthesis never holds up the results for short ones. A prompt passes if at
+    least one council member responded and the chairman produced a synthesis.
+    """
+    backend = backend or load_backend()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(prompt):
+        async with semaphore:
+            try:
+                stage1_results, _, stage3_result, _ = await backend.collect_council_result(prompt)
+            except Exception as e:
+                return False, f"error: {e}"
+        if not stage1_results:
+            return False, "no council member responded"
+        if stage3_result.get('response') == backend.STAGE3_ERROR_RESPONSE:
+            return False, "chairman synthesis failed"
+        return True, f"{len(stage1_results)}/{len(backend.COUNCIL_MODELS)} members responded"
+
+    print("=" * 80)
+    print(f"LLM Governance Council - Prompt Suite ({len(prompts)} prompts)")
+    print("=" * 80)
+
+    passed = 0
+    try:
+        if not backend.disk_cache.readable:
+            await backend.openrouter.prewarm(list(dict.fromkeys([*backend.COUNCIL_MODELS, backend.CHAIRMAN_MODEL])))
+        for name, bucket in zip(("short", "medium", "long"), bin_prompts(prompts)):
+            if not bucket:
+                continue
+            print()
+            print(f"Bin: {name} ({len(bucket)} prompts)")
+            outcomes = await asyncio.gather(*[run_one(prompt) for prompt in bucket])
+            for prompt, (ok, detail) in zip(bucket, outcomes):
+                passed += ok
+                summary = prompt if len(prompt) <= 60 else prompt[:57] + "..."
+                print(f"  {'✅ PASS' if ok else '❌ FAIL'}: {summary} ({detail})")
+    finally:
+        await backend.openrouter.aclose()
+
+    print()
+    print("=" * 80)
+    print(f"SUITE RESULT: {passed}/{len(prompts)} prompts passed")
+    print("=" * 80)
+    return passed == len(prompts)
+
+
+def run_async(coro):
+    """Run a coroutine on uvloop when it is installed, else on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
 
 def main():
     """Run the test."""
+    parser = argparse.ArgumentParser(description="Test Mistral integration in LLM Governance Council")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="query every model again instead of replaying cached responses from disk",
+    )
+    parser.add_argument(
+        "--require-mistral",
+        action="store_true",
+        help="fail if Mistral does not respond even in Stage 1 quorum mode (STAGE1_QUORUM < 1.0), "
+        "where a missing reply is otherwise only a warning",
+    )
+    parser.add_argument(
+        "--suite",
+        action="store_true",
+        help="run the multi-prompt suite (bucketed by expected output length) instead of the Mistral test",
+    )
+    args = parser.parse_args()
+
+    # Default WARNING level: enough for logger.exception, without httpx logging every request
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    # Add backend to path
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+    backend = load_backend()
+
+    # Repeat runs replay model responses from the on-disk cache unless --no-cache is given
+    backend.disk_cache.set_mode("off" if args.no_cache else "readwrite")
+
     # Check if API key is set
     if not os.getenv('OPENROUTER_API_KEY'):
         print("❌ ERROR: OPENROUTER_API_KEY environment variable is not set")
@@ -167,7 +416,10 @@ def main():
         sys.exit(1)
     
     # Run the async test
-    result = asyncio.run(test_mistral_integration())
+    if args.suite:
+        result = run_async(run_suite(backend=backend))
+    else:
+        result = run_async(test_mistral_integration(require_mistral=args.require_mistral, backend=backend))
     sys.exit(0 if result else 1)
 
 